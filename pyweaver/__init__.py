@@ -50,95 +50,195 @@ Path: pyweaver/__init__.py
 # Version information
 __version__ = '1.0.0'
 
-# Import processors and their components
-from .processors import (
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> defining subpackage. Subpackages (and pydantic, which the
+# configuration classes need) are imported on first attribute access
+# (PEP 562), so importing a single submodule stays cheap.
+_LAZY_IMPORTS = {
     # Structure generation
-    SortOrder,
-    StructureOptions,
-    StructurePrinter,
-    generate_structure,
+    'SortOrder': 'processors',
+    'StructureOptions': 'processors',
+    'StructurePrinter': 'processors',
+    'generate_structure': 'processors',
 
     # File combining
-    CombinerProgress,
-    FileCombinerProcessor,
-    combine_files,
+    'CombinerProgress': 'processors',
+    'FileCombinerProcessor': 'processors',
+    'combine_files': 'processors',
 
     # Init file generation
-    InitFileProgress,
-    InitFileProcessor,
-    generate_init_files
-)
+    'InitFileProgress': 'processors',
+    'InitFileProcessor': 'processors',
+    'generate_init_files': 'processors',
 
-# Import configuration components
-from .config import (
     # Base configuration
-    ConfigValidationModel,
-    BaseConfig,
+    'ConfigValidationModel': 'config',
+    'BaseConfig': 'config',
 
     # Path configuration
-    PathSettings,
-    PathConfig,
+    'PathSettings': 'config',
+    'PathConfig': 'config',
 
     # Init configuration
-    ImportOrderPolicy,
-    ImportSection,
-    ExportMode,
-    InitSectionConfig,
-    InlineContent,
-    InitSettings,
-    InitConfig,
+    'ImportOrderPolicy': 'config',
+    'ImportSection': 'config',
+    'ExportMode': 'config',
+    'InitSectionConfig': 'config',
+    'InlineContent': 'config',
+    'InitSettings': 'config',
+    'InitConfig': 'config',
 
     # File combiner configuration
-    ContentMode,
-    FileSectionConfig,
-    CombinerConfig
-)
+    'ContentMode': 'config',
+    'FileSectionConfig': 'config',
+    'CombinerConfig': 'config',
 
-# Import common components
-from .common import (
     # Base processor
-    ListingStyle,
-    ProcessorState,
-    ProcessorProgress,
-    ProcessorResult,
-    BaseProcessor,
+    'ListingStyle': 'common',
+    'ProcessorState': 'common',
+    'ProcessorProgress': 'common',
+    'ProcessorResult': 'common',
+    'BaseProcessor': 'common',
 
     # Error handling
-    ErrorCategory,
-    ErrorCode,
-    ErrorContext,
-    ProcessingError,
-    FileError,
-    ConfigError,
-    StateError,
-    ValidationError,
+    'ErrorCategory': 'common',
+    'ErrorCode': 'common',
+    'ErrorContext': 'common',
+    'ProcessingError': 'common',
+    'FileError': 'common',
+    'ConfigError': 'common',
+    'StateError': 'common',
+    'ValidationError': 'common',
 
     # Tracking
-    TrackerType,
-    TrackerState,
-    ItemStatus,
-    TrackedItem,
-    TrackerStats,
-    FileTracker
-)
-
-# Import utilities
-from .utils import (
+    'TrackerType': 'common',
+    'TrackerState': 'common',
+    'ItemStatus': 'common',
+    'TrackedItem': 'common',
+    'TrackerStats': 'common',
+    'FileTracker': 'common',
+
     # Module analysis
-    ImportInfo,
-    FunctionInfo,
-    ClassInfo,
-    ModuleInfo,
-    ModuleAnalyzer,
+    'ImportInfo': 'utils',
+    'FunctionInfo': 'utils',
+    'ClassInfo': 'utils',
+    'ModuleInfo': 'utils',
+    'ModuleAnalyzer': 'utils',
 
     # Pattern matching
-    PatternType,
-    PatternCache,
-    PatternMatcher,
+    'PatternType': 'utils',
+    'PatternCache': 'utils',
+    'PatternMatcher': 'utils',
 
     # Representation
-    comprehensive_repr
-)
+    'comprehensive_repr': 'utils'
+}
+
+if TYPE_CHECKING:
+    # Import processors and their components
+    from .processors import (
+        # Structure generation
+        SortOrder,
+        StructureOptions,
+        StructurePrinter,
+        generate_structure,
+
+        # File combining
+        CombinerProgress,
+        FileCombinerProcessor,
+        combine_files,
+
+        # Init file generation
+        InitFileProgress,
+        InitFileProcessor,
+        generate_init_files
+    )
+
+    # Import configuration components
+    from .config import (
+        # Base configuration
+        ConfigValidationModel,
+        BaseConfig,
+
+        # Path configuration
+        PathSettings,
+        PathConfig,
+
+        # Init configuration
+        ImportOrderPolicy,
+        ImportSection,
+        ExportMode,
+        InitSectionConfig,
+        InlineContent,
+        InitSettings,
+        InitConfig,
+
+        # File combiner configuration
+        ContentMode,
+        FileSectionConfig,
+        CombinerConfig
+    )
+
+    # Import common components
+    from .common import (
+        # Base processor
+        ListingStyle,
+        ProcessorState,
+        ProcessorProgress,
+        ProcessorResult,
+        BaseProcessor,
+
+        # Error handling
+        ErrorCategory,
+        ErrorCode,
+        ErrorContext,
+        ProcessingError,
+        FileError,
+        ConfigError,
+        StateError,
+        ValidationError,
+
+        # Tracking
+        TrackerType,
+        TrackerState,
+        ItemStatus,
+        TrackedItem,
+        TrackerStats,
+        FileTracker
+    )
+
+    # Import utilities
+    from .utils import (
+        # Module analysis
+        ImportInfo,
+        FunctionInfo,
+        ClassInfo,
+        ModuleInfo,
+        ModuleAnalyzer,
+
+        # Pattern matching
+        PatternType,
+        PatternCache,
+        PatternMatcher,
+
+        # Representation
+        comprehensive_repr
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a public package attribute on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 # Define public API
 __all__ = [
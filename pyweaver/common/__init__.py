@@ -34,33 +34,78 @@ Example:
 Path: pyweaver/common/__init__.py
 """
 
-from .base import (
-    ProcessorState,
-    ProcessorProgress,
-    ProcessorResult,
-    BaseProcessor
-)
-from .enums import (
-    ListingStyle
-)
-from .errors import (
-    ErrorCategory,
-    ErrorCode,
-    ErrorContext,
-    ProcessingError,
-    FileError,
-    ConfigError,
-    StateError,
-    ValidationError
-)
-from .tracking import (
-    TrackerType,
-    TrackerState,
-    ItemStatus,
-    TrackedItem,
-    TrackerStats,
-    FileTracker
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access (PEP 562), so importing errors or tracking does not
+# pull in the processor base class and its pydantic-backed configuration.
+_LAZY_IMPORTS = {
+    'ProcessorState': 'base',
+    'ProcessorProgress': 'base',
+    'ProcessorResult': 'base',
+    'BaseProcessor': 'base',
+
+    'ListingStyle': 'enums',
+
+    'ErrorCategory': 'errors',
+    'ErrorCode': 'errors',
+    'ErrorContext': 'errors',
+    'ProcessingError': 'errors',
+    'FileError': 'errors',
+    'ConfigError': 'errors',
+    'StateError': 'errors',
+    'ValidationError': 'errors',
+
+    'TrackerType': 'tracking',
+    'TrackerState': 'tracking',
+    'ItemStatus': 'tracking',
+    'TrackedItem': 'tracking',
+    'TrackerStats': 'tracking',
+    'FileTracker': 'tracking'
+}
+
+if TYPE_CHECKING:
+    from .base import (
+        ProcessorState,
+        ProcessorProgress,
+        ProcessorResult,
+        BaseProcessor
+    )
+    from .enums import (
+        ListingStyle
+    )
+    from .errors import (
+        ErrorCategory,
+        ErrorCode,
+        ErrorContext,
+        ProcessingError,
+        FileError,
+        ConfigError,
+        StateError,
+        ValidationError
+    )
+    from .tracking import (
+        TrackerType,
+        TrackerState,
+        ItemStatus,
+        TrackedItem,
+        TrackerStats,
+        FileTracker
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 __all__ = [
     'ProcessorState',
@@ -14,12 +14,16 @@ The module implements:
 
 Path: pyweaver/common/base.py
 """
+import fnmatch
 import logging
+import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
-from typing import List, Optional
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any, Callable, List, Optional
 from contextlib import contextmanager
 import time
 
@@ -31,6 +35,38 @@ from pyweaver.common.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Path.match compares case-insensitively on Windows
+_MATCH_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+
+@lru_cache(maxsize=1024)
+def _name_matcher(pattern: str) -> Optional[Callable[[str], Any]]:
+    """Compile a single-component glob pattern into a name matcher.
+
+    Such patterns only ever match the final path component under
+    Path.match, so a precompiled regex applied to the name gives the
+    same answer without re-parsing the pattern for every path.
+
+    Args:
+        pattern: Glob pattern to compile
+
+    Returns:
+        Regex match function for the name, or None if the pattern has
+        several components or an anchor and needs Path.match
+    """
+    if not pattern:
+        return None
+    pure = PurePath(pattern)
+    if len(pure.parts) != 1 or pure.anchor:
+        return None
+    return re.compile(fnmatch.translate(pure.parts[0]), _MATCH_FLAGS).match
+
+def _path_matches(path: Path, pattern: str) -> bool:
+    """Check a path against a glob pattern with Path.match semantics."""
+    name_match = _name_matcher(pattern)
+    if name_match is None:
+        return path.match(pattern)
+    return name_match(path.name) is not None
+
 class ProcessorState(Enum):
     """States a processor can be in during its lifecycle.
 
@@ -83,7 +119,7 @@ class ProcessorProgress:
         """Check if processing is complete."""
         return (self.processed_items + self.ignored_items + self.error_items) == self.total_items
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorResult:
     """Results from a processing operation.
 
@@ -292,7 +328,7 @@ class BaseProcessor(ABC):
 
         # Check ignore patterns
         for pattern in settings.ignore_patterns:
-            if path.match(pattern):
+            if _path_matches(path, pattern):
                 self._add_warning(
                     f"Ignoring {path} (matches pattern {pattern})"
                 )
@@ -301,7 +337,7 @@ class BaseProcessor(ABC):
         # Check include patterns if specified
         if settings.include_patterns:
             for pattern in settings.include_patterns:
-                if path.match(pattern):
+                if _path_matches(path, pattern):
                     return True
             return False
 
@@ -2,7 +2,7 @@
 
 from enum import Enum
 
-class ListingStyle(Enum):
+class ListingStyle(str, Enum):
     """Output style for structure listings.
 
     This enum defines different ways to format the directory structure,
@@ -13,7 +13,7 @@ The module implements:
 
 Path: pyweaver/common/errors.py
 """
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -95,9 +95,15 @@ class ErrorCode(Enum):
     @property
     def category(self) -> ErrorCategory:
         """Get the category for this error code."""
-        return ErrorCategory(''.join(c for c in self.value if c.isalpha()))
+        return _CODE_TO_CATEGORY[self]
 
-@dataclass
+# Category lookup table, built once from the alphabetic prefix of each code
+_CODE_TO_CATEGORY: Dict[ErrorCode, ErrorCategory] = {
+    code: ErrorCategory(''.join(c for c in code.value if c.isalpha()))
+    for code in ErrorCode
+}
+
+@dataclass(slots=True)
 class ErrorContext:
     """Detailed context information for processing errors.
 
@@ -108,30 +114,73 @@ class ErrorContext:
         operation: Name of the operation that failed
         error_code: Specific error code
         path: Optional path related to the error
-        details: Optional dictionary of additional details
-        timestamp: When the error occurred
-        stack: List of nested error contexts for tracking error chain
+        details: Optional dictionary of additional details (None when empty)
+        stack: Optional list of nested error contexts for tracking error chain,
+            created on the first add_context call
     """
     operation: str
     error_code: ErrorCode
     path: Optional[Path] = None
-    details: Dict[str, Any] = field(default_factory=dict)
-    stack: List['ErrorContext'] = field(default_factory=list)
+    details: Optional[Dict[str, Any]] = None
+    stack: Optional[List['ErrorContext']] = None
 
     def add_context(self, context: 'ErrorContext') -> None:
         """Add nested error context to the stack."""
+        if self.stack is None:
+            self.stack = []
         self.stack.append(context)
 
     def format_details(self) -> str:
         """Format error details for display."""
-        parts = []
-        if self.path:
-            parts.append(f"path: {self.path}")
-        if self.operation:
-            parts.append(f"operation: {self.operation}")
-        if self.details:
-            parts.extend(f"{k}: {v}" for k, v in self.details.items())
-        return " | ".join(parts)
+        path, operation, details = self.path, self.operation, self.details
+        if path:
+            head = f"path: {path} | operation: {operation}" if operation else f"path: {path}"
+        elif operation:
+            head = f"operation: {operation}"
+        elif not details:
+            return ""
+        else:
+            return " | ".join([f"{k}: {v}" for k, v in details.items()])
+
+        if not details:
+            return head
+        return " | ".join([head, *[f"{k}: {v}" for k, v in details.items()]])
+
+def _build_context(
+    operation_default: str,
+    code_default: ErrorCode,
+    *,
+    context: Optional[ErrorContext],
+    operation: Optional[str],
+    path: Optional[Path] = None,
+    details: Optional[Dict[str, Any]] = None
+) -> ErrorContext:
+    """Merge error information into a context, creating one if needed.
+
+    Args:
+        operation_default: Operation name used when none is given
+        code_default: Error code for a newly created context
+        context: Optional existing context to update in place
+        operation: Optional operation name for a new context
+        path: Optional path, overriding the path of an existing context
+        details: Optional details merged into the context
+
+    Returns:
+        The updated or newly created error context
+    """
+    if context is None:
+        return ErrorContext(
+            operation or operation_default, code_default, path, details or None
+        )
+
+    if path is not None:
+        context.path = path
+    if details:
+        if context.details:
+            context.details.update(details)
+        else:
+            context.details = dict(details)
+    return context
 
 class ProcessingError(Exception):
     """Base error for all processing operations.
@@ -164,27 +213,51 @@ class ProcessingError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.context = context or (
-            ErrorContext(
+        self._context = context
+        # Context creation from operation/path is deferred until first access
+        self._ctx_args = (
+            (operation, path) if context is None and (operation or path) else None
+        )
+        self._str_cache: Optional[str] = None
+        self.original_error = original_error
+
+    @property
+    def context(self) -> Optional[ErrorContext]:
+        """Get the error context, building it on first access if needed."""
+        if self._ctx_args is not None:
+            operation, path = self._ctx_args
+            self._ctx_args = None
+            self._context = ErrorContext(
                 operation=operation or "unknown_operation",
                 error_code=ErrorCode.PROCESS_GENERAL,
                 path=path
-            ) if operation or path else None
-        )
-        self.original_error = original_error
+            )
+        return self._context
+
+    @context.setter
+    def context(self, value: Optional[ErrorContext]) -> None:
+        """Replace the error context and drop any cached formatting."""
+        self._context = value
+        self._ctx_args = None
+        self._str_cache = None
 
     def __str__(self) -> str:
         """Format error message with context."""
+        if self._str_cache is not None:
+            return self._str_cache
+
         parts = [self.message]
-        if self.context:
-            details = self.context.format_details()
+        context = self.context
+        if context:
+            details = context.format_details()
             if details:
                 parts.append(f"({details})")
-            if self.context.stack:
+            if context.stack:
                 parts.append("Error stack:")
-                for ctx in self.context.stack:
+                for ctx in context.stack:
                     parts.append(f"  - {ctx.error_code.value}: {ctx.format_details()}")
-        return " ".join(parts)
+        self._str_cache = " ".join(parts)
+        return self._str_cache
 
 class FileError(ProcessingError):
     """Error specific to file operations.
@@ -214,15 +287,11 @@ class FileError(ProcessingError):
             operation: Optional operation name
             original_error: Optional original exception
         """
-        # Create context if not provided, ensuring path is included
-        if context:
-            context.path = path  # Override path in provided context
-        else:
-            context = ErrorContext(
-                operation=operation or "file_operation",
-                error_code=ErrorCode.FILE_GENERAL,
-                path=path
-            )
+        # Path always overrides the path of a provided context
+        context = _build_context(
+            "file_operation", ErrorCode.FILE_GENERAL,
+            context=context, operation=operation, path=path
+        )
 
         super().__init__(
             message,
@@ -257,16 +326,10 @@ class ConfigError(ProcessingError):
             config_details: Optional configuration details
             original_error: Optional original exception
         """
-        if context:
-            if config_details:
-                context.details = context.details or {}
-                context.details.update(config_details)
-        else:
-            context = ErrorContext(
-                operation=operation or "configuration",
-                error_code=ErrorCode.CONFIG_GENERAL,
-                details=config_details or {}
-            )
+        context = _build_context(
+            "configuration", ErrorCode.CONFIG_GENERAL,
+            context=context, operation=operation, details=config_details
+        )
 
         super().__init__(
             message,
@@ -313,16 +376,10 @@ class StateError(ProcessingError):
             "current_state": current_state,
             "expected_state": expected_state
         }
-
-        if context:
-            context.details = context.details or {}
-            context.details.update(state_details)
-        else:
-            context = ErrorContext(
-                operation=operation or "state_management",
-                error_code=ErrorCode.STATE_INVALID,
-                details=state_details
-            )
+        context = _build_context(
+            "state_management", ErrorCode.STATE_INVALID,
+            context=context, operation=operation, details=state_details
+        )
 
         super().__init__(
             message,
@@ -360,18 +417,12 @@ class ValidationError(ProcessingError):
             constraints: Optional validation constraints
             original_error: Optional original exception
         """
-        if context:
-            if details:
-                context.details = context.details or {}
-                context.details.update(details)
-            if constraints:
-                context.details["constraints"] = constraints
-        else:
-            context = ErrorContext(
-                operation=operation or "validation",
-                error_code=ErrorCode.VALIDATION_GENERAL,
-                details={**(details or {}), "constraints": constraints} if constraints else details
-            )
+        if constraints:
+            details = {**(details or {}), "constraints": constraints}
+        context = _build_context(
+            "validation", ErrorCode.VALIDATION_GENERAL,
+            context=context, operation=operation, details=details
+        )
 
         super().__init__(
             message,
@@ -15,11 +15,15 @@ The module implements:
 Path: pyweaver/common/tracking.py
 """
 import logging
-from enum import Enum
+import os
+import sys
+from array import array
+from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple, NamedTuple
+from typing import Any, Optional, Dict, Iterable, List, Tuple, NamedTuple
 from threading import Lock
-from dataclasses import dataclass, field
+from queue import SimpleQueue, Empty
+from dataclasses import dataclass
 import time
 
 from pyweaver.utils.repr import comprehensive_repr
@@ -29,6 +33,45 @@ from pyweaver.common.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Error context templates as (operation, error_code) pairs for tracker failures
+_CTX_INIT_TRACKER = ("init_tracker", ErrorCode.PROCESS_INIT)
+_CTX_ADD_PENDING = ("add_pending", ErrorCode.PROCESS_STATE)
+_CTX_MARK_PROCESSED = ("mark_processed", ErrorCode.PROCESS_STATE)
+_CTX_MARK_ERROR = ("mark_error", ErrorCode.PROCESS_STATE)
+_CTX_MARK_IGNORED = ("mark_ignored", ErrorCode.PROCESS_STATE)
+_CTX_NEXT_PENDING = ("next_pending", ErrorCode.PROCESS_STATE)
+
+def _key(path: Path | str) -> str:
+    """Get the dictionary key for a tracked path.
+
+    Uses the path's filesystem string, so Path and str arguments that name
+    the same item share a key and lookups hash a string instead of a Path.
+
+    Args:
+        path: Path to convert
+
+    Returns:
+        String key for the path
+    """
+    return os.fspath(path)
+
+def _make_ctx(
+    template: Tuple[str, ErrorCode],
+    path: Optional[Path] = None,
+    **details: Any
+) -> ErrorContext:
+    """Build an error context from a static template.
+
+    Args:
+        template: (operation, error_code) pair
+        path: Optional path related to the error
+        **details: Additional context details
+
+    Returns:
+        ErrorContext populated from the template
+    """
+    return ErrorContext(template[0], template[1], path, details or None)
+
 class TrackerType(Enum):
     """Types of items that can be tracked.
 
@@ -39,31 +82,68 @@ class TrackerType(Enum):
     DIRECTORIES = "directories"
     BOTH = "both"
 
-class TrackerState(Enum):
+class TrackerState(IntEnum):
     """Possible states of the tracker.
 
     This enum represents the various operational states of the tracker,
     helping manage the tracker's lifecycle.
     """
-    INITIALIZED = "initialized"
-    ACTIVE = "active"
-    PAUSED = "paused"
-    COMPLETED = "completed"
-    ERROR = "error"
+    INITIALIZED = 0
+    ACTIVE = 1
+    PAUSED = 2
+    COMPLETED = 3
+    ERROR = 4
 
-class ItemStatus(Enum):
+class ItemStatus(IntEnum):
     """Status of tracked items.
 
     This enum represents the various states an item can be in during processing,
-    providing clear status tracking.
+    providing clear status tracking. Values double as indexes into the
+    tracker's count table and follow the TrackerStats field order.
     """
-    PENDING = "pending"
-    PROCESSING = "processing"
-    PROCESSED = "processed"
-    IGNORED = "ignored"
-    ERROR = "error"
+    PENDING = 0
+    PROCESSING = 1
+    PROCESSED = 2
+    IGNORED = 3
+    ERROR = 4
+
+# Tracker states in which new items may be added
+_ADD_OK = frozenset((TrackerState.INITIALIZED, TrackerState.ACTIVE))
+
+# Item statuses from which an item may be marked as processed
+_MARK_OK = frozenset((ItemStatus.PENDING, ItemStatus.PROCESSING))
+
+@dataclass(slots=True)
+class _ErrorDescriptor:
+    """Lightweight record of a non-ProcessingError failure.
+
+    Stored on tracked items in place of a full ProcessingError and promoted
+    only when the error is reported through get_errors.
+
+    Attributes:
+        message: Error message
+        original: Exception that occurred
+    """
+    message: str
+    original: Exception
+
+    def to_error(self, path: Path) -> ProcessingError:
+        """Build the full ProcessingError for this failure.
 
-@dataclass
+        Args:
+            path: Path of the item that failed
+
+        Returns:
+            ProcessingError wrapping the original exception
+        """
+        return ProcessingError(
+            self.message,
+            operation="process_item",
+            path=path,
+            original_error=self.original
+        )
+
+@dataclass(slots=True)
 class TrackedItem:
     """Information about a tracked item.
 
@@ -75,13 +155,13 @@ class TrackedItem:
         status: Current status of the item
         error: Optional error information if processing failed
         attempts: Number of processing attempts
-        timestamp: When the item was last updated
+        timestamp: Monotonic time when the item was last updated
     """
     path: Path
     status: ItemStatus = ItemStatus.PENDING
-    error: Optional[ProcessingError] = None
+    error: Optional[ProcessingError | _ErrorDescriptor] = None
     attempts: int = 0
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0
 
 class TrackerStats(NamedTuple):
     """Statistical information about tracked items.
@@ -106,8 +186,11 @@ class FileTracker:
         type: What type of items to track
         state: Current operational state
         max_attempts: Maximum processing attempts per item
-        _items: Dictionary of all tracked items
-        _lock: Thread synchronization lock
+        _items: Dictionary of all tracked items keyed by interned path string
+        _pending_q: FIFO queue of path keys awaiting processing
+        _counts: Number of items in each status, indexed by status value
+        _error_items: Items currently in ERROR status, keyed by object id
+        _lock: Thread synchronization lock for item state transitions
 
     Example:
         ```python
@@ -150,7 +233,10 @@ class FileTracker:
             self.state = TrackerState.INITIALIZED
             self.max_attempts = max_attempts
 
-            self._items: Dict[Path, TrackedItem] = {}
+            self._items: Dict[str, TrackedItem] = {}
+            self._pending_q: SimpleQueue = SimpleQueue()
+            self._counts = array('i', [0] * len(ItemStatus))
+            self._error_items: Dict[int, TrackedItem] = {}
             self._lock = Lock()
 
             logger.debug(
@@ -159,10 +245,10 @@ class FileTracker:
             )
 
         except Exception as e:
-            context = ErrorContext(
-                operation="init_tracker",
-                error_code=ErrorCode.PROCESS_INIT,
-                details={"type": type_items.value, "max_attempts": max_attempts}
+            context = _make_ctx(
+                _CTX_INIT_TRACKER,
+                type=type_items.value,
+                max_attempts=max_attempts
             )
             raise ProcessingError(
                 "Failed to initialize tracker",
@@ -170,36 +256,49 @@ class FileTracker:
                 original_error=e
             ) from e
 
-    def add_pending(self, path: Path) -> None:
+    def add_pending(
+        self,
+        path: Path,
+        *,
+        is_file: Optional[bool] = None,
+        is_dir: Optional[bool] = None
+    ) -> None:
         """Add an item to the pending set if it matches tracker type.
 
+        Callers that already know the item type (e.g. from a directory walk)
+        can pass it as a hint to avoid a filesystem stat per item.
+
         Args:
             path: Path to potentially pending item
+            is_file: Optional hint that the item is a regular file
+            is_dir: Optional hint that the item is a directory
 
         Raises:
             ValidationError: If path is invalid
             StateError: If tracker is in invalid state
         """
         try:
-            if self.state not in {TrackerState.INITIALIZED, TrackerState.ACTIVE}:
+            if self.state not in _ADD_OK:
                 raise StateError("Tracker must be initialized or active to add items")
 
-            if not self._validate_item_type(path):
-                logger.debug("Skipping item %s: wrong type for tracker", path)
+            if not self._validate_item_type(path, is_file, is_dir):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Skipping item %s: wrong type for tracker", path)
                 return
 
+            key = sys.intern(_key(path))
+            now = time.monotonic()
             with self._lock:
-                if path not in self._items:
-                    self._items[path] = TrackedItem(path)
-                    self.state = TrackerState.ACTIVE
-                    logger.debug("Added pending item: %s", path)
+                if key not in self._items:
+                    self._items[key] = TrackedItem(path, timestamp=now)
+                    self._counts[ItemStatus.PENDING] += 1
+                    self._pending_q.put(key)
+                    if self.state is TrackerState.INITIALIZED:
+                        self.state = TrackerState.ACTIVE
 
         except Exception as e:
-            context = ErrorContext(
-                operation="add_pending",
-                error_code=ErrorCode.PROCESS_STATE,
-                path=path,
-                details={"tracker_type": self.type.value}
+            context = _make_ctx(
+                _CTX_ADD_PENDING, path, tracker_type=self.type.value
             )
             raise ProcessingError(
                 f"Failed to add pending item: {path}",
@@ -217,23 +316,23 @@ class FileTracker:
             StateError: If item doesn't exist or is in invalid state
         """
         try:
+            key = _key(path)
+            now = time.monotonic()
             with self._lock:
-                if item := self._items.get(path):
-                    if item.status not in {ItemStatus.PENDING, ItemStatus.PROCESSING}:
-                        raise StateError(f"Cannot mark item as processed from state: {item.status}")
+                if item := self._items.get(key):
+                    if item.status not in _MARK_OK:
+                        raise StateError(f"Cannot mark item as processed from state: {item.status.name}")
 
-                    item.status = ItemStatus.PROCESSED
-                    item.timestamp = time.time()
-                    logger.debug("Marked item as processed: %s", path)
+                    self._transition(item, ItemStatus.PROCESSED)
+                    item.timestamp = now
                 else:
                     raise StateError(f"Item not found: {path}")
 
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Marked item as processed: %s", path)
+
         except Exception as e:
-            context = ErrorContext(
-                operation="mark_processed",
-                error_code=ErrorCode.PROCESS_STATE,
-                path=path
-            )
+            context = _make_ctx(_CTX_MARK_PROCESSED, path)
             raise ProcessingError(
                 f"Failed to mark item as processed: {path}",
                 context=context,
@@ -251,26 +350,26 @@ class FileTracker:
             StateError: If item doesn't exist
         """
         try:
+            key = _key(path)
+            now = time.monotonic()
             with self._lock:
-                if item := self._items.get(path):
-                    item.status = ItemStatus.ERROR
-                    item.error = error if isinstance(error, ProcessingError) else ProcessingError(
-                        str(error),
-                        operation="process_item",
-                        path=path,
-                        original_error=error
+                if item := self._items.get(key):
+                    item.error = error if isinstance(error, ProcessingError) else _ErrorDescriptor(
+                        str(error), error
                     )
-                    item.timestamp = time.time()
+                    item.timestamp = now
                     item.attempts += 1
 
                     # If max attempts not reached, requeue
                     if item.attempts < self.max_attempts:
-                        item.status = ItemStatus.PENDING
+                        self._transition(item, ItemStatus.PENDING)
+                        self._pending_q.put(key)
                         logger.warning(
                             "Item %s failed (attempt %d/%d), requeueing",
                             path, item.attempts, self.max_attempts
                         )
                     else:
+                        self._transition(item, ItemStatus.ERROR)
                         logger.error(
                             "Item %s failed after %d attempts, marking as error",
                             path, item.attempts
@@ -279,11 +378,8 @@ class FileTracker:
                     raise StateError(f"Item not found: {path}")
 
         except Exception as e:
-            context = ErrorContext(
-                operation="mark_error",
-                error_code=ErrorCode.PROCESS_STATE,
-                path=path,
-                details={"original_error": str(error)}
+            context = _make_ctx(
+                _CTX_MARK_ERROR, path, original_error=str(error)
             )
             raise ProcessingError(
                 f"Failed to mark item error: {path}",
@@ -301,37 +397,87 @@ class FileTracker:
             StateError: If item doesn't exist
         """
         try:
+            key = _key(path)
+            now = time.monotonic()
             with self._lock:
-                if item := self._items.get(path):
-                    item.status = ItemStatus.IGNORED
-                    item.timestamp = time.time()
-                    logger.debug("Marked item as ignored: %s", path)
+                if item := self._items.get(key):
+                    self._transition(item, ItemStatus.IGNORED)
+                    item.timestamp = now
                 else:
                     raise StateError(f"Item not found: {path}")
 
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Marked item as ignored: %s", path)
+
         except Exception as e:
-            context = ErrorContext(
-                operation="mark_ignored",
-                error_code=ErrorCode.PROCESS_STATE,
-                path=path
-            )
+            context = _make_ctx(_CTX_MARK_IGNORED, path)
             raise ProcessingError(
                 f"Failed to mark item as ignored: {path}",
                 context=context,
                 original_error=e
             ) from e
 
+    def mark_processed_many(self, paths: Iterable[Path]) -> int:
+        """Mark several items as processed under a single lock acquisition.
+
+        Items that are not tracked or are not pending/processing are skipped
+        rather than raising, so a batch is never partially rejected.
+
+        Args:
+            paths: Paths to processed items
+
+        Returns:
+            Number of items marked as processed
+        """
+        keys = [_key(path) for path in paths]
+        marked = 0
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                item = self._items.get(key)
+                if item and item.status in _MARK_OK:
+                    self._transition(item, ItemStatus.PROCESSED)
+                    item.timestamp = now
+                    marked += 1
+
+        logger.debug("Marked %d of %d items as processed", marked, len(keys))
+        return marked
+
+    def mark_ignored_many(self, paths: Iterable[Path]) -> int:
+        """Mark several items as ignored under a single lock acquisition.
+
+        Items that are not tracked are skipped rather than raising.
+
+        Args:
+            paths: Paths to ignored items
+
+        Returns:
+            Number of items marked as ignored
+        """
+        keys = [_key(path) for path in paths]
+        marked = 0
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                if item := self._items.get(key):
+                    self._transition(item, ItemStatus.IGNORED)
+                    item.timestamp = now
+                    marked += 1
+
+        logger.debug("Marked %d of %d items as ignored", marked, len(keys))
+        return marked
+
     def has_pending(self) -> bool:
         """Check if there are any pending items.
 
+        The check reads the per-status counts, which every transition keeps
+        in sync, instead of scanning all tracked items.
+
         Returns:
             True if there are pending items to process
         """
         with self._lock:
-            return any(
-                item.status == ItemStatus.PENDING
-                for item in self._items.values()
-            )
+            return self._counts[ItemStatus.PENDING] > 0
 
     def next_pending(self) -> Optional[Path]:
         """Get next pending item and mark it as processing.
@@ -343,20 +489,27 @@ class FileTracker:
             StateError: If tracker is in invalid state
         """
         try:
-            with self._lock:
-                for item in self._items.values():
-                    if item.status == ItemStatus.PENDING:
-                        item.status = ItemStatus.PROCESSING
-                        item.timestamp = time.time()
-                        logger.debug("Retrieved next pending item: %s", item.path)
-                        return item.path
-                return None
+            now = time.monotonic()
+            while True:
+                try:
+                    key = self._pending_q.get_nowait()
+                except Empty:
+                    return None
+
+                with self._lock:
+                    item = self._items.get(key)
+                    # Skip stale queue entries resolved since they were queued
+                    if item is None or item.status != ItemStatus.PENDING:
+                        continue
+                    self._transition(item, ItemStatus.PROCESSING)
+                    item.timestamp = now
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Retrieved next pending item: %s", item.path)
+                return item.path
 
         except Exception as e:
-            context = ErrorContext(
-                operation="next_pending",
-                error_code=ErrorCode.PROCESS_STATE
-            )
+            context = _make_ctx(_CTX_NEXT_PENDING)
             raise ProcessingError(
                 "Failed to get next pending item",
                 context=context,
@@ -370,18 +523,7 @@ class FileTracker:
             TrackerStats with current counts
         """
         with self._lock:
-            counts = {status: 0 for status in ItemStatus}
-            for item in self._items.values():
-                counts[item.status] += 1
-
-            return TrackerStats(
-                pending=counts[ItemStatus.PENDING],
-                processing=counts[ItemStatus.PROCESSING],
-                processed=counts[ItemStatus.PROCESSED],
-                ignored=counts[ItemStatus.IGNORED],
-                errors=counts[ItemStatus.ERROR],
-                total=len(self._items)
-            )
+            return TrackerStats(*self._counts, total=len(self._items))
 
     def get_errors(self) -> List[Tuple[Path, ProcessingError]]:
         """Get list of all items that encountered errors.
@@ -390,11 +532,14 @@ class FileTracker:
             List of tuples containing path and error information
         """
         with self._lock:
-            return [
-                (item.path, item.error)
-                for item in self._items.values()
-                if item.status == ItemStatus.ERROR and item.error
-            ]
+            errors = []
+            for item in self._error_items.values():
+                if not item.error:
+                    continue
+                if isinstance(item.error, _ErrorDescriptor):
+                    item.error = item.error.to_error(item.path)
+                errors.append((item.path, item.error))
+            return errors
 
     def cleanup(self) -> None:
         """Clear all tracking state and reset tracker.
@@ -403,14 +548,45 @@ class FileTracker:
         """
         with self._lock:
             self._items.clear()
+            self._pending_q = SimpleQueue()
+            self._counts = array('i', [0] * len(ItemStatus))
+            self._error_items.clear()
             self.state = TrackerState.COMPLETED
             logger.debug("Cleaned up tracker state")
 
-    def _validate_item_type(self, path: Path) -> bool:
+    def _transition(self, item: TrackedItem, status: ItemStatus) -> None:
+        """Move an item to a new status, keeping counts and error index in sync.
+
+        Must be called with the tracker lock held.
+
+        Args:
+            item: Item to update
+            status: New status for the item
+        """
+        counts = self._counts
+        counts[item.status] -= 1
+        counts[status] += 1
+        if status == ItemStatus.ERROR:
+            self._error_items[id(item)] = item
+        elif item.status == ItemStatus.ERROR:
+            del self._error_items[id(item)]
+        item.status = status
+
+    def _validate_item_type(
+        self,
+        path: Path,
+        is_file: Optional[bool] = None,
+        is_dir: Optional[bool] = None
+    ) -> bool:
         """Check if an item matches the tracker type.
 
+        Type hints from the caller are used when present; the filesystem is
+        only queried when no applicable hint was given.
+
         Args:
             path: Path to validate
+            is_file: Optional hint that the item is a regular file
+            is_dir: Optional hint that the item is a directory
 
         Returns:
             True if item matches tracker type
@@ -419,8 +595,16 @@ class FileTracker:
             if self.type == TrackerType.BOTH:
                 return True
             elif self.type == TrackerType.FILES:
+                if is_file is not None:
+                    return is_file
+                if is_dir:
+                    return False
                 return path.is_file()
             else:  # TrackerType.DIRECTORIES
+                if is_dir is not None:
+                    return is_dir
+                if is_file:
+                    return False
                 return path.is_dir()
 
         except Exception as e:
@@ -30,28 +30,69 @@ Example:
 Path: pyweaver/config/__init__.py
 """
 
-from .base import (
-    ConfigValidationModel,
-    BaseConfig
-)
-from .path import (
-    PathSettings,
-    PathConfig
-)
-from .init import (
-    ImportOrderPolicy,
-    ImportSection,
-    ExportMode,
-    InitSectionConfig,
-    InlineContent,
-    InitSettings,
-    InitConfig
-)
-from .combiner import (
-    ContentMode,
-    FileSectionConfig,
-    CombinerConfig
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> defining submodule. Submodules, and pydantic with them,
+# are imported on first attribute access (PEP 562).
+_LAZY_IMPORTS = {
+    'ConfigValidationModel': 'base',
+    'BaseConfig': 'base',
+
+    'PathSettings': 'path',
+    'PathConfig': 'path',
+
+    'ImportOrderPolicy': 'init',
+    'ImportSection': 'init',
+    'ExportMode': 'init',
+    'InitSectionConfig': 'init',
+    'InlineContent': 'init',
+    'InitSettings': 'init',
+    'InitSettingsView': 'init',
+    'InitConfig': 'init',
+
+    'ContentMode': 'combiner',
+    'FileSectionConfig': 'combiner',
+    'CombinerConfig': 'combiner'
+}
+
+if TYPE_CHECKING:
+    from .base import (
+        ConfigValidationModel,
+        BaseConfig
+    )
+    from .path import (
+        PathSettings,
+        PathConfig
+    )
+    from .init import (
+        ImportOrderPolicy,
+        ImportSection,
+        ExportMode,
+        InitSectionConfig,
+        InlineContent,
+        InitSettings,
+        InitSettingsView,
+        InitConfig
+    )
+    from .combiner import (
+        ContentMode,
+        FileSectionConfig,
+        CombinerConfig
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a public configuration class on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 __all__ = [
     'ConfigValidationModel',
@@ -66,6 +107,7 @@ __all__ = [
     'InitSectionConfig',
     'InlineContent',
     'InitSettings',
+    'InitSettingsView',
     'InitConfig',
 
     'ContentMode',
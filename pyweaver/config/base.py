@@ -17,16 +17,33 @@ Key features:
 Path: pyweaver/config/base.py
 """
 from pathlib import Path
-from typing import Dict, Any, Optional, Generic, TypeVar, get_args
+from typing import (
+    Dict, Any, ClassVar, List, Optional, Generic, Tuple, TypeVar, get_args, get_origin
+)
 import json
 import logging
+import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pydantic import BaseModel, Field, field_validator
 
 from pyweaver.common.errors import (ConfigError, ErrorContext, ErrorCode)
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _as_path(path: str) -> Path:
+    """Convert a path string to a Path, sharing instances across reloads."""
+    return Path(path)
+
+# Maximum number of per-path effective settings cached by each config
+_SETTINGS_CACHE_SIZE = 512
+
 # Type variable for settings models
 SettingsT = TypeVar('SettingsT', bound=BaseModel)
 
@@ -44,6 +61,10 @@ class ConfigValidationModel(BaseModel, Generic[SettingsT]):
     global_settings: SettingsT
     path_specific: Dict[Path, SettingsT] = Field(default_factory=dict)
 
+    # Concrete settings model, populated for each parameterized class by
+    # __pydantic_init_subclass__ so validators never introspect generics
+    _settings_type: ClassVar[Optional[type[BaseModel]]] = None
+
     model_config = {
         "arbitrary_types_allowed": True,
         "json_encoders": {
@@ -51,6 +72,13 @@ class ConfigValidationModel(BaseModel, Generic[SettingsT]):
         }
     }
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the settings model when a parameterized class is built."""
+        super().__pydantic_init_subclass__(**kwargs)
+        args = cls.__pydantic_generic_metadata__['args']
+        cls._settings_type = args[0] if args else None
+
     @field_validator('path_specific')
     @classmethod
     def validate_paths(cls, v: Dict) -> Dict[Path, Any]:
@@ -64,19 +92,11 @@ class ConfigValidationModel(BaseModel, Generic[SettingsT]):
 
         Returns:
             Dictionary with validated and normalized paths
-
-        Raises:
-            ValueError: If paths are invalid
         """
-        validated = {}
-        for path, settings in v.items():
-            try:
-                if isinstance(path, str):
-                    path = Path(path)
-                validated[path] = settings
-            except Exception as e:
-                raise ValueError(f"Invalid path '{path}': {e}") from e
-        return validated
+        return {
+            _as_path(path) if isinstance(path, str) else path: settings
+            for path, settings in v.items()
+        }
 
     @field_validator('global_settings')
     @classmethod
@@ -95,15 +115,10 @@ class ConfigValidationModel(BaseModel, Generic[SettingsT]):
         Raises:
             ValueError: If settings are invalid
         """
-        try:
-            settings_type = get_args(cls.__orig_bases__[0])[0]
-            if not isinstance(v, settings_type):
-                raise ValueError(
-                    f"Global settings must be instance of {settings_type.__name__}"
-                )
-        except (IndexError, AttributeError):
-            settings_type = cls.__annotations__.get('global_settings', dict)
-        return settings_type(**v) if isinstance(v, dict) else v
+        settings_type = cls._settings_type
+        if settings_type is None or isinstance(v, settings_type):
+            return v
+        return settings_type.model_validate(v)
 
 class BaseConfig(ABC, Generic[SettingsT]):
     """Abstract base class for configuration management.
@@ -121,7 +136,7 @@ class BaseConfig(ABC, Generic[SettingsT]):
 
         class MyConfig(BaseConfig[MySettings]):
             def _validate_config(self, data):
-                return ConfigValidationModel[MySettings](**data)
+                return self._validation_model(**data)
 
             def _merge_settings(self, base, override):
                 return MySettings(
@@ -135,6 +150,19 @@ class BaseConfig(ABC, Generic[SettingsT]):
         ```
     """
 
+    # ConfigValidationModel parameterized with the subclass's settings type
+    _validation_model: ClassVar[Optional[type]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Parameterize the validation model once for each concrete settings type."""
+        super().__init_subclass__(**kwargs)
+        for base in cls.__dict__.get('__orig_bases__', ()):
+            if get_origin(base) is BaseConfig:
+                settings_type = get_args(base)[0]
+                if not isinstance(settings_type, TypeVar):
+                    cls._validation_model = ConfigValidationModel[settings_type]
+                break
+
     def __init__(
         self,
         global_settings: Optional[Dict[str, Any]] = None,
@@ -156,12 +184,16 @@ class BaseConfig(ABC, Generic[SettingsT]):
                 "path_specific": path_specific or {}
             })
 
+            # Bounded, thread-safe settings cache keyed by path string. The
+            # wrapper is per instance so cached entries die with the config.
+            self._settings_cache = lru_cache(maxsize=_SETTINGS_CACHE_SIZE)(
+                self._compute_settings
+            )
+
+            # Assigning through the properties builds the prefix index
             self.global_settings = validated.global_settings
             self.path_specific = validated.path_specific
 
-            # Initialize cache
-            self._settings_cache: Dict[Path, SettingsT] = {}
-
             logger.debug(
                 "Initialized configuration with %d path-specific settings",
                 len(self.path_specific)
@@ -200,8 +232,9 @@ class BaseConfig(ABC, Generic[SettingsT]):
             if isinstance(config_path, str):
                 config_path = Path(config_path)
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # Parse raw bytes; orjson raises a json.JSONDecodeError subclass
+            with open(config_path, 'rb') as f:
+                config_data = _json_loads(f.read())
 
             return cls(**config_data)
 
@@ -249,73 +282,127 @@ class BaseConfig(ABC, Generic[SettingsT]):
         Raises:
             ConfigError: If settings cannot be retrieved
         """
-        try:
-            if isinstance(path, str):
-                path = Path(path)
+        # Normalize strings such as "./src/x" and "src/x/" to match Path keys
+        return self._settings_cache(os.fspath(Path(path)))
+
+    def _compute_settings(self, path_str: str) -> SettingsT:
+        """Compute effective settings for a path string without caching.
+
+        Args:
+            path_str: Path string to get settings for
 
-            # Check cache first
-            if path in self._settings_cache:
-                return self._settings_cache[path]
+        Returns:
+            Settings instance with combined configuration
 
+        Raises:
+            ConfigError: If settings cannot be computed
+        """
+        try:
             # Start with global settings
             effective_settings = self._merge_settings(
                 self.global_settings,
                 path_settings=None
             )
 
-            # Apply any matching path-specific settings
-            for config_path, settings in self.path_specific.items():
-                if self._is_path_match(path, config_path):
-                    effective_settings = self._merge_settings(
-                        effective_settings,
-                        settings
-                    )
+            # Apply matching path-specific settings, shallowest first
+            for settings in self._find_path_settings(path_str):
+                effective_settings = self._merge_settings(
+                    effective_settings,
+                    settings
+                )
 
-            # Cache and return results
-            self._settings_cache[path] = effective_settings
             return effective_settings
 
-        except Exception as e:
+        except (ConfigError, ValueError, TypeError, KeyError, AttributeError) as e:
             context = ErrorContext(
                 operation="get_settings",
                 error_code=ErrorCode.CONFIG_PATH,
-                path=path,
+                path=path_str,
                 details={
                     "config_paths": [str(p) for p in self.path_specific.keys()]
                 }
             )
             raise ConfigError(
-                f"Failed to get configuration settings for {path}",
+                f"Failed to get configuration settings for {path_str}",
                 context=context,
                 original_error=e
             ) from e
 
+    @property
+    def global_settings(self) -> SettingsT:
+        """Settings applied to every path."""
+        return self._global_settings
+
+    @global_settings.setter
+    def global_settings(self, value: SettingsT) -> None:
+        """Replace global settings, invalidating cached effective settings."""
+        self._global_settings = value
+        self._settings_cache.cache_clear()
+
+    @property
+    def path_specific(self) -> Dict[Path, SettingsT]:
+        """Path-specific setting overrides.
+
+        Reassigning this attribute re-indexes the paths and invalidates
+        cached settings; call clear_cache() after mutating it in place.
+        """
+        return self._path_specific
+
+    @path_specific.setter
+    def path_specific(self, value: Dict[Path, SettingsT]) -> None:
+        """Replace path-specific settings, invalidating cached settings."""
+        self._path_specific = value
+        self._path_prefixes = self._build_prefix_index(value)
+        self._settings_cache.cache_clear()
+
     def clear_cache(self) -> None:
         """Clear the settings cache.
 
         This method should be called when configuration changes or when
         memory needs to be freed.
         """
-        self._settings_cache.clear()
+        self._settings_cache.cache_clear()
         logger.debug("Cleared settings cache")
 
-    def _is_path_match(self, path: Path, config_path: Path) -> bool:
-        """Check if a path matches a configuration path.
+    @staticmethod
+    def _build_prefix_index(
+        path_specific: Dict[Path, SettingsT]
+    ) -> List[Tuple[int, Dict[str, SettingsT]]]:
+        """Group configured paths by the length of their string form.
+
+        Args:
+            path_specific: Path-specific settings to index
+
+        Returns:
+            (length, {path string: settings}) pairs sorted by length
+        """
+        by_length: Dict[int, Dict[str, SettingsT]] = {}
+        for config_path, settings in path_specific.items():
+            config_str = os.fspath(config_path)
+            by_length.setdefault(len(config_str), {})[config_str] = settings
+        return sorted(by_length.items())
 
-        This method determines whether a given path should inherit settings
-        from a configuration path.
+    def _find_path_settings(self, path: str) -> List[SettingsT]:
+        """Find the path-specific settings whose path is a prefix of a path.
+
+        A path matches a configuration path when its string form starts with
+        the configuration path string. Each indexed length costs one slice
+        and one dict lookup, independent of how many paths are configured.
 
         Args:
-            path: Path to check
-            config_path: Configuration path to match against
+            path: Path string to match
 
         Returns:
-            True if path matches the configuration path
+            Matching settings ordered from the shortest to the longest prefix
         """
-        try:
-            return str(path).startswith(str(config_path))
-        except Exception:
-            return False
+        matches = []
+        path_len = len(path)
+        for length, entries in self._path_prefixes:
+            if length > path_len:
+                break
+            if (settings := entries.get(path[:length])) is not None:
+                matches.append(settings)
+        return matches
 
     @abstractmethod
     def _validate_config(self, config_data: Dict[str, Any]) -> ConfigValidationModel[SettingsT]:
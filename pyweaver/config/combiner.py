@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from string import Formatter
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 import logging
 
 from pyweaver.common.enums import ListingStyle
@@ -11,7 +13,88 @@ from pyweaver.utils.patterns import PatternMatcher
 
 logger = logging.getLogger(__name__)
 
-class ContentMode(Enum):
+# Default section templates, with the header split around its {path} field
+_DEFAULT_HEADER_PREFIX = "#" * 80 + "\n# Source: "
+_DEFAULT_HEADER_SUFFIX = "\n" + "#" * 80
+_DEFAULT_HEADER_TEMPLATE = _DEFAULT_HEADER_PREFIX + "{path}" + _DEFAULT_HEADER_SUFFIX
+_DEFAULT_FOOTER_TEMPLATE = "\n"
+
+# Errors str.format raises for bad templates or unresolvable fields
+_TEMPLATE_ERRORS = (KeyError, IndexError, ValueError, AttributeError, TypeError)
+
+# Parsed section template: (literal text, field name or None) pairs
+TemplateParts = Tuple[Tuple[str, Optional[str]], ...]
+
+@lru_cache(maxsize=256)
+def _parse_template(template: str) -> Optional[TemplateParts]:
+    """Split a section template into literal text and plain field names.
+
+    Templates are parsed once per distinct text, so every section rendered
+    with the same template shares one parsed form.
+
+    Args:
+        template: Section template in str.format syntax
+
+    Returns:
+        Parsed template parts, or None if the template needs str.format
+        (format specs, conversions, attribute/index or positional fields,
+        or malformed braces)
+    """
+    try:
+        parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+def _render_template(template: str, path: Path, kwargs: Dict[str, Any]) -> str:
+    """Render a section template for a file.
+
+    Args:
+        template: Section template in str.format syntax
+        path: Path to the file, available as {path}
+        kwargs: Additional template variables
+
+    Returns:
+        Rendered template
+
+    Raises:
+        KeyError: If the template references an unknown field
+        IndexError, ValueError, AttributeError, TypeError: If the template
+            is malformed or its fields cannot be resolved
+    """
+    if 'path' in kwargs or 'type' in kwargs:
+        return template.format(path=path, type=path.suffix.lstrip('.'), **kwargs)
+
+    # Literal templates need no formatting at all
+    if '{' not in template and '}' not in template:
+        return template
+
+    parts = _parse_template(template)
+    if parts is None:
+        return template.format(path=path, type=path.suffix.lstrip('.'), **kwargs)
+
+    out = []
+    for literal, field_name in parts:
+        out.append(literal)
+        if field_name is None:
+            continue
+        if field_name == 'path':
+            out.append(str(path))
+        elif field_name == 'type':
+            out.append(path.suffix.lstrip('.'))
+        else:
+            out.append(str(kwargs[field_name]))
+    return ''.join(out)
+
+class ContentMode(str, Enum):
     """Processing modes for file content.
 
     This enum defines how file content should be processed during combining.
@@ -22,7 +105,7 @@ class ContentMode(Enum):
     NO_DOCSTRINGS = "no_docstrings"  # Remove docstrings only
     MINIMAL = "minimal"      # Remove both comments and docstrings
 
-@dataclass
+@dataclass(slots=True)
 class FileSectionConfig:
     """Configuration for file sections in combined output.
 
@@ -37,8 +120,8 @@ class FileSectionConfig:
         remove_trailing_whitespace: Whether to trim line endings
     """
     enabled: bool = True
-    header_template: str = "#" * 80 + "\n# Source: {path}\n" + "#" * 80
-    footer_template: str = "\n"
+    header_template: str = _DEFAULT_HEADER_TEMPLATE
+    footer_template: str = _DEFAULT_FOOTER_TEMPLATE
     include_empty_lines: bool = True
     remove_trailing_whitespace: bool = True
 
@@ -52,13 +135,13 @@ class FileSectionConfig:
         Returns:
             Formatted header string
         """
+        if (self.header_template == _DEFAULT_HEADER_TEMPLATE
+                and 'path' not in kwargs and 'type' not in kwargs):
+            return _DEFAULT_HEADER_PREFIX + str(path) + _DEFAULT_HEADER_SUFFIX
+
         try:
-            return self.header_template.format(
-                path=path,
-                type=path.suffix.lstrip('.'),
-                **kwargs
-            )
-        except Exception as e:
+            return _render_template(self.header_template, path, kwargs)
+        except _TEMPLATE_ERRORS as e:
             raise ValidationError(
                 f"Failed to format header template: {e}",
                 details={"template": self.header_template, "path": str(path)}
@@ -74,13 +157,13 @@ class FileSectionConfig:
         Returns:
             Formatted footer string
         """
+        if (self.footer_template == _DEFAULT_FOOTER_TEMPLATE
+                and 'path' not in kwargs and 'type' not in kwargs):
+            return _DEFAULT_FOOTER_TEMPLATE
+
         try:
-            return self.footer_template.format(
-                path=path,
-                type=path.suffix.lstrip('.'),
-                **kwargs
-            )
-        except Exception as e:
+            return _render_template(self.footer_template, path, kwargs)
+        except _TEMPLATE_ERRORS as e:
             raise ValidationError(
                 f"Failed to format footer template: {e}",
                 details={"template": self.footer_template, "path": str(path)}
@@ -121,27 +204,40 @@ class CombinerConfig(PathConfig):
     structure_format: ListingStyle = ListingStyle.TREE
     include_empty_dirs: bool = False
 
+    @property
+    def compiled_file_patterns(self) -> Optional[Pattern]:
+        """Single regex matching any of the configured file patterns.
+
+        Searching a relative path (with forward slashes) with this regex is
+        equivalent to testing each file pattern in turn. Compiled regexes
+        are cached per distinct pattern set, so this stays cheap to read
+        and reflects later changes to file_patterns.
+
+        Raises:
+            ValidationError: If a pattern is invalid
+        """
+        return PatternMatcher.compile_path_patterns(self.file_patterns)
+
     def validate_patterns(self) -> None:
         """Validate file patterns configuration.
 
-        This method ensures all file patterns are valid and properly formatted.
+        This method ensures all file patterns are valid and properly formatted
+        by compiling them into the combined file pattern regex.
 
         Raises:
             ValidationError: If patterns are invalid
         """
         try:
-            pattern_matcher = PatternMatcher()
             for pattern in self.file_patterns:
                 if not pattern or not isinstance(pattern, str):
                     raise ValueError(f"Invalid pattern: {pattern}")
 
-                # Try to use pattern to validate format
-                if not pattern_matcher.matches_path_pattern("test.txt", pattern):
-                    logger.debug("Pattern validation passed: %s", pattern)
+            # Compiling is the validation: invalid globs raise here
+            PatternMatcher.compile_path_patterns(self.file_patterns)
 
         except Exception as e:
             raise ValidationError(
                 "Invalid file patterns configuration",
                 details={"patterns": self.file_patterns},
                 original_error=e
-            ) from e
\ No newline at end of file
+            ) from e
@@ -20,20 +20,44 @@ The module integrates with our broader configuration ecosystem by:
 
 Path: pyweaver/config/init.py
 """
+import bisect
 import logging
 import json
+import os
+from collections import OrderedDict
 from enum import Enum
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Set, List, Optional, Any
+from typing import Dict, FrozenSet, Mapping, NamedTuple, Set, List, Optional, Any, Tuple
 from pydantic import BaseModel, Field, field_validator
 
-from pyweaver.config.base import BaseConfig, ConfigValidationModel
+from pyweaver.config.base import _SETTINGS_CACHE_SIZE, BaseConfig, ConfigValidationModel
 from pyweaver.common.errors import (ConfigError, ErrorContext, ErrorCode)
 from pyweaver.utils.patterns import PatternMatcher
-from pyweaver.utils.repr import comprehensive_repr
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+def _union(base: Set[str], extra: Set[str]) -> Set[str]:
+    """Union two pattern sets, reusing base when extra adds nothing."""
+    return base | extra if extra else base
+
+def _load_config_data(config_path: Path) -> Dict[str, Any]:
+    """Read and parse a JSON configuration file.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Parsed configuration data
+    """
+    with open(config_path, 'rb') as f:
+        return _json_loads(f.read())
+
 class ImportOrderPolicy(str, Enum):
     """Controls how imports are ordered within init files.
 
@@ -57,24 +81,30 @@ class ImportSection(str, Enum):
     TYPE_DEFINITIONS = "type_definitions"
     VARIABLES = "variables"
 
-    def get_default_patterns(self) -> Set[str]:
+    def get_default_patterns(self) -> FrozenSet[str]:
         """Get default patterns for identifying content for this section."""
-        if self == ImportSection.CONSTANTS:
-            return {"*_CONSTANT", "*_CONFIG", "DEFAULT_*"}
-        elif self == ImportSection.TYPE_DEFINITIONS:
-            return {"*Type", "*Config"}
-        return {"*"}
+        return _SECTION_DEFAULT_PATTERNS.get(self, _ANY_NAME)
 
     def get_default_order(self) -> int:
         """Get the default ordering position for this section."""
-        section_orders = {
-            ImportSection.TYPE_DEFINITIONS: 0,
-            ImportSection.CONSTANTS: 1,
-            ImportSection.CLASSES: 2,
-            ImportSection.FUNCTIONS: 3,
-            ImportSection.VARIABLES: 4
-        }
-        return section_orders.get(self, 99)
+        return _SECTION_DEFAULT_ORDERS.get(self, 99)
+
+# Shared, immutable section defaults
+_ANY_NAME: FrozenSet[str] = frozenset({"*"})
+_SECTION_DEFAULT_PATTERNS: Dict[ImportSection, FrozenSet[str]] = {
+    ImportSection.CONSTANTS: frozenset({"*_CONSTANT", "*_CONFIG", "DEFAULT_*"}),
+    ImportSection.TYPE_DEFINITIONS: frozenset({"*Type", "*Config"})
+}
+_SECTION_BY_NAME: Dict[str, ImportSection] = {
+    section.value: section for section in ImportSection
+}
+_SECTION_DEFAULT_ORDERS: Dict[ImportSection, int] = {
+    ImportSection.TYPE_DEFINITIONS: 0,
+    ImportSection.CONSTANTS: 1,
+    ImportSection.CLASSES: 2,
+    ImportSection.FUNCTIONS: 3,
+    ImportSection.VARIABLES: 4
+}
 
 class ExportMode(str, Enum):
     """Defines how exports are collected from modules.
@@ -119,17 +149,11 @@ class InitSectionConfig(BaseModel):
         Returns:
             True if name should be included
         """
-        # Check exclusions first
-        if any(pattern_matcher.matches_name_pattern(name, pattern)
-               for pattern in self.exclude_patterns):
-            return False
-
-        # Check inclusions if specified
-        if self.include_patterns:
-            return any(pattern_matcher.matches_name_pattern(name, pattern)
-                      for pattern in self.include_patterns)
-
-        return True
+        # One regex encodes both the exclusions and the inclusions
+        predicate = pattern_matcher.compile_name_predicate(
+            self.include_patterns, self.exclude_patterns
+        )
+        return predicate.match(name) is not None
 
 class InlineContent(BaseModel):
     """Configuration for inline content injection.
@@ -177,21 +201,22 @@ class InitSettings(BaseModel):
         default values where needed.
         """
         try:
-            valid_sections = {section.value for section in ImportSection}
             validated = {}
 
             for name, config in v.items():
-                if name not in valid_sections:
+                section = _SECTION_BY_NAME.get(name)
+                if section is None:
                     raise ValueError(f"Invalid section name: {name}")
 
                 # Apply defaults based on section type
-                section = ImportSection(name)
                 if not config.include_patterns:
-                    config.include_patterns = section.get_default_patterns()
+                    config.include_patterns = set(section.get_default_patterns())
                 if config.order == 0:
                     config.order = section.get_default_order()
 
-                validated[name] = config
+                # Key by the enum's own (interned) value string rather than
+                # the parsed key, so later lookups hit the identity fast path
+                validated[section.value] = config
 
             return validated
 
@@ -206,6 +231,78 @@ class InitSettings(BaseModel):
             raise ValueError("Custom export mode requires exports_blacklist")
         return v
 
+    def as_view(self) -> 'InitSettingsView':
+        """Freeze these settings into a read-only InitSettingsView.
+
+        Returns:
+            Snapshot of the current settings values
+        """
+        return InitSettingsView(
+            docstring=self.docstring,
+            order_policy=self.order_policy,
+            exports_blacklist=frozenset(self.exports_blacklist),
+            excluded_paths=frozenset(self.excluded_paths),
+            collect_from_submodules=self.collect_from_submodules,
+            include_submodules=(
+                tuple(self.include_submodules)
+                if self.include_submodules is not None else None
+            ),
+            sections=self.sections,
+            inline_content=self.inline_content,
+            custom_order=(
+                tuple(self.custom_order)
+                if self.custom_order is not None else None
+            ),
+            dependencies=tuple(self.dependencies),
+            exact_path_only=self.exact_path_only,
+            export_mode=self.export_mode
+        )
+
+class InitSettingsView(NamedTuple):
+    """Read-only snapshot of effective InitSettings.
+
+    Field reads are plain tuple accesses, which makes this the cheaper form
+    for code that reads the same settings repeatedly. Section and inline
+    content models are shared with the source settings, not copied.
+    """
+    docstring: Optional[str]
+    order_policy: ImportOrderPolicy
+    exports_blacklist: FrozenSet[str]
+    excluded_paths: FrozenSet[str]
+    collect_from_submodules: bool
+    include_submodules: Optional[Tuple[str, ...]]
+    sections: Mapping[str, InitSectionConfig]
+    inline_content: Mapping[str, InlineContent]
+    custom_order: Optional[Tuple[str, ...]]
+    dependencies: Tuple[str, ...]
+    exact_path_only: bool
+    export_mode: ExportMode
+
+# Default configuration written by InitConfig._create_default_config, and
+# its serialized form, built once at import. Must not be mutated.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "global_settings": {
+        "docstring": "Auto-generated __init__.py file.",
+        "order_policy": ImportOrderPolicy.DEPENDENCY_FIRST.value,
+        "sections": {
+            section.value: {
+                "enabled": True,
+                "order": section.get_default_order(),
+                "include_patterns": sorted(section.get_default_patterns())
+            }
+            for section in (
+                ImportSection.CLASSES,
+                ImportSection.FUNCTIONS,
+                ImportSection.CONSTANTS
+            )
+        },
+        "export_mode": ExportMode.ALL_PUBLIC.value,
+        "collect_from_submodules": True
+    },
+    "path_specific": {}
+}
+_DEFAULT_CONFIG_BYTES = json.dumps(_DEFAULT_CONFIG, indent=4).encode('utf-8')
+
 class InitConfig(BaseConfig[InitSettings]):
     """Configuration manager for init file generation.
 
@@ -257,6 +354,8 @@ class InitConfig(BaseConfig[InitSettings]):
         try:
             super().__init__(global_settings, path_specific)
             self.pattern_matcher = pattern_matcher or PatternMatcher()
+            # Least recently used views are evicted beyond _SETTINGS_CACHE_SIZE
+            self._view_cache: OrderedDict[str, Tuple[InitSettings, InitSettingsView]] = OrderedDict()
 
             logger.debug(
                 "Initialized InitConfig with %d path-specific settings",
@@ -302,9 +401,7 @@ class InitConfig(BaseConfig[InitSettings]):
             if not config_path.exists():
                 return cls._create_default_config(config_path, root_dir)
 
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-
+            config_data = _load_config_data(config_path)
             return cls(**config_data)
 
         except Exception as e:
@@ -320,6 +417,139 @@ class InitConfig(BaseConfig[InitSettings]):
                 original_error=e
             ) from e
 
+    @classmethod
+    def from_file_lazy(cls, config_path: Path | str) -> 'InitConfig':
+        """Create configuration from JSON file, validating path entries on demand.
+
+        Global settings are validated immediately. Path-specific entries are
+        kept as raw data and each is validated the first time a settings
+        lookup matches it, so large configs only pay for the paths visited.
+        Invalid entries raise ConfigError from get_settings_for_path. A
+        default configuration is created when the file does not exist.
+
+        Args:
+            config_path: Path to configuration file
+
+        Returns:
+            Initialized InitConfig instance
+
+        Raises:
+            ConfigError: If configuration loading fails
+        """
+        try:
+            config_path = Path(config_path)
+
+            if not config_path.exists():
+                return cls._create_default_config(config_path)
+
+            config_data = _load_config_data(config_path)
+
+            config = cls(global_settings=config_data.get("global_settings"))
+            config._raw_prefixes = cls._build_prefix_index({
+                Path(path): raw
+                for path, raw in (config_data.get("path_specific") or {}).items()
+            })
+            return config
+
+        except Exception as e:
+            context = ErrorContext(
+                operation="load_config",
+                error_code=ErrorCode.CONFIG_PATH,
+                path=config_path
+            )
+            raise ConfigError(
+                "Failed to load configuration file",
+                context=context,
+                original_error=e
+            ) from e
+
+    def get_settings_view(self, path: Path | str) -> InitSettingsView:
+        """Get effective settings for a path as a read-only view.
+
+        The view is built once per merged settings instance and reused while
+        get_settings_for_path keeps returning that instance, so it follows
+        configuration changes that invalidate the settings cache. Like the
+        settings cache, at most _SETTINGS_CACHE_SIZE views are kept.
+
+        Args:
+            path: Path to get settings for
+
+        Returns:
+            Read-only view of the effective settings
+
+        Raises:
+            ConfigError: If settings cannot be retrieved
+        """
+        path_str = os.fspath(Path(path))
+        settings = self.get_settings_for_path(path_str)
+        cached = self._view_cache.get(path_str)
+        if cached is not None and cached[0] is settings:
+            self._view_cache.move_to_end(path_str)
+            return cached[1]
+
+        view = settings.as_view()
+        self._view_cache[path_str] = (settings, view)
+        self._view_cache.move_to_end(path_str)
+        if len(self._view_cache) > _SETTINGS_CACHE_SIZE:
+            self._view_cache.popitem(last=False)
+        return view
+
+    @BaseConfig.path_specific.setter
+    def path_specific(self, value: Dict[Path, InitSettings]) -> None:
+        """Replace path-specific settings, discarding unvalidated entries."""
+        BaseConfig.path_specific.fset(self, value)
+        self._raw_prefixes: List[Tuple[int, Dict[str, Dict[str, Any]]]] = []
+
+    def clear_cache(self) -> None:
+        """Clear cached settings and settings views."""
+        super().clear_cache()
+        self._view_cache.clear()
+
+    def _find_path_settings(self, path: str) -> List[InitSettings]:
+        """Find matching path-specific settings, validating lazy entries first.
+
+        Raw entries loaded by from_file_lazy whose path is a prefix of the
+        given path are validated and moved into path_specific, so each entry
+        is validated at most once.
+
+        Args:
+            path: Path string to match
+
+        Returns:
+            Matching settings ordered from the shortest to the longest prefix
+
+        Raises:
+            ValueError: If a matching raw entry is invalid
+        """
+        path_len = len(path)
+        for length, entries in self._raw_prefixes:
+            if length > path_len:
+                break
+            key = path[:length]
+            if (raw := entries.get(key)) is not None:
+                self._add_path_settings(key, InitSettings.model_validate(raw))
+                del entries[key]
+
+        return super()._find_path_settings(path)
+
+    def _add_path_settings(self, key: str, settings: InitSettings) -> None:
+        """Add validated settings to path_specific and its prefix index.
+
+        Args:
+            key: Configured path string
+            settings: Validated settings for the path
+        """
+        self._path_specific[Path(key)] = settings
+        for length, entries in self._path_prefixes:
+            if length == len(key):
+                entries[key] = settings
+                return
+        bisect.insort(
+            self._path_prefixes,
+            (len(key), {key: settings}),
+            key=itemgetter(0)
+        )
+
     def _validate_config(self, config_data: Dict[str, Any]) -> ConfigValidationModel[InitSettings]:
         """Validate raw configuration data.
 
@@ -336,7 +566,7 @@ class InitConfig(BaseConfig[InitSettings]):
             ConfigError: If validation fails
         """
         try:
-            return ConfigValidationModel[InitSettings](**config_data)
+            return self._validation_model(**config_data)
         except Exception as e:
             context = ErrorContext(
                 operation="validate_config",
@@ -368,48 +598,60 @@ class InitConfig(BaseConfig[InitSettings]):
             path_settings: Optional path-specific settings to merge
 
         Returns:
-            New InitSettings instance with merged configuration
+            Merged settings; base itself when path_settings overrides
+            nothing, so callers must treat the result as read-only
 
         Raises:
             ConfigError: If settings merge fails
         """
         try:
-            if not path_settings:
-                return base.model_copy()
+            if not path_settings or not self._has_overrides(base, path_settings):
+                return base
+
+            # Merge sections, copying the base mapping only when overridden
+            sections = base.sections
+            if path_settings.sections:
+                sections = dict(sections)
+                for name, section in path_settings.sections.items():
+                    base_section = sections.get(name)
+                    if base_section is None:
+                        sections[name] = section
+                        continue
+                    sections[name] = InitSectionConfig.model_construct(
+                        enabled=section.enabled,
+                        order=section.order if section.order is not None else base_section.order,
+                        header_comment=section.header_comment or base_section.header_comment,
+                        footer_comment=section.footer_comment or base_section.footer_comment,
+                        separator=section.separator,
+                        include_patterns=_union(base_section.include_patterns, section.include_patterns),
+                        exclude_patterns=_union(base_section.exclude_patterns, section.exclude_patterns)
+                    )
 
-            merged = InitSettings(
+            inline_content = base.inline_content
+            if path_settings.inline_content:
+                inline_content = {**inline_content, **path_settings.inline_content}
+
+            # Inputs are already validated models, so skip re-validation.
+            # Containers the override leaves unchanged are shared with base,
+            # as base.model_copy() already does.
+            merged = InitSettings.model_construct(
                 docstring=path_settings.docstring or base.docstring,
                 order_policy=path_settings.order_policy,
-                exports_blacklist=base.exports_blacklist | path_settings.exports_blacklist,
-                excluded_paths=base.excluded_paths | path_settings.excluded_paths,
+                exports_blacklist=_union(base.exports_blacklist, path_settings.exports_blacklist),
+                excluded_paths=_union(base.excluded_paths, path_settings.excluded_paths),
                 collect_from_submodules=path_settings.collect_from_submodules,
                 include_submodules=path_settings.include_submodules or base.include_submodules,
+                sections=sections,
+                inline_content=inline_content,
                 custom_order=path_settings.custom_order or base.custom_order,
-                dependencies=base.dependencies + path_settings.dependencies,
+                dependencies=(
+                    base.dependencies + path_settings.dependencies
+                    if path_settings.dependencies else base.dependencies
+                ),
                 exact_path_only=path_settings.exact_path_only,
                 export_mode=path_settings.export_mode
             )
 
-            # Merge sections
-            merged.sections = base.sections.copy()
-            for name, section in path_settings.sections.items():
-                if name in merged.sections:
-                    base_section = merged.sections[name]
-                    merged.sections[name] = InitSectionConfig(
-                        enabled=section.enabled,
-                        order=section.order if section.order is not None else base_section.order,
-                        header_comment=section.header_comment or base_section.header_comment,
-                        footer_comment=section.footer_comment or base_section.footer_comment,
-                        separator=section.separator,
-                        include_patterns=base_section.include_patterns | section.include_patterns,
-                        exclude_patterns=base_section.exclude_patterns | section.exclude_patterns
-                    )
-                else:
-                    merged.sections[name] = section
-
-            # Merge inline content
-            merged.inline_content = {**base.inline_content, **path_settings.inline_content}
-
             return merged
 
         except Exception as e:
@@ -427,6 +669,32 @@ class InitConfig(BaseConfig[InitSettings]):
                 original_error=e
             ) from e
 
+    @staticmethod
+    def _has_overrides(base: InitSettings, path_settings: InitSettings) -> bool:
+        """Check whether merging path_settings into base changes anything.
+
+        Args:
+            base: Base settings to merge into
+            path_settings: Path-specific settings to merge
+
+        Returns:
+            True if the merged settings would differ from base
+        """
+        return bool(
+            path_settings.sections
+            or path_settings.inline_content
+            or path_settings.exports_blacklist
+            or path_settings.excluded_paths
+            or path_settings.docstring
+            or path_settings.include_submodules
+            or path_settings.custom_order
+            or path_settings.dependencies
+            or path_settings.order_policy != base.order_policy
+            or path_settings.collect_from_submodules != base.collect_from_submodules
+            or path_settings.exact_path_only != base.exact_path_only
+            or path_settings.export_mode != base.export_mode
+        )
+
     @classmethod
     def _create_default_config(cls, config_path: Path, root_dir: Optional[Path] = None) -> 'InitConfig':
         """Create and save default configuration.
@@ -445,45 +713,17 @@ class InitConfig(BaseConfig[InitSettings]):
             ConfigError: If default config creation fails
         """
         try:
-            default_config = {
-                "global_settings": {
-                    "docstring": "Auto-generated __init__.py file.",
-                    "order_policy": ImportOrderPolicy.DEPENDENCY_FIRST.value,
-                    "sections": {
-                        ImportSection.CLASSES.value: {
-                            "enabled": True,
-                            "order": ImportSection.CLASSES.get_default_order(),
-                            "include_patterns": list(ImportSection.CLASSES.get_default_patterns())
-                        },
-                        ImportSection.FUNCTIONS.value: {
-                            "enabled": True,
-                            "order": ImportSection.FUNCTIONS.get_default_order(),
-                            "include_patterns": list(ImportSection.FUNCTIONS.get_default_patterns())
-                        },
-                        ImportSection.CONSTANTS.value: {
-                            "enabled": True,
-                            "order": ImportSection.CONSTANTS.get_default_order(),
-                            "include_patterns": list(ImportSection.CONSTANTS.get_default_patterns())
-                        }
-                    },
-                    "export_mode": ExportMode.ALL_PUBLIC.value,
-                    "collect_from_submodules": True
-                },
-                "path_specific": {}
-            }
-
             # Create config directory if needed
             config_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Save default configuration
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(default_config, f, indent=4)
+            config_path.write_bytes(_DEFAULT_CONFIG_BYTES)
 
             logger.info(
                 "Created default configuration at %s",
                 config_path
             )
-            return cls(**default_config)
+            return cls(**_DEFAULT_CONFIG)
 
         except Exception as e:
             context = ErrorContext(
@@ -501,7 +741,22 @@ class InitConfig(BaseConfig[InitSettings]):
             ) from e
 
     def __repr__(self) -> str:
-        """Get string representation of configuration."""
+        """Get a concise string representation of configuration.
+
+        This stays cheap enough for debug logging; use detailed_repr() for
+        the full settings tree.
+        """
+        return (
+            f"{type(self).__name__}("
+            f"sections={len(self.global_settings.sections)}, "
+            f"paths={len(self.path_specific)})"
+        )
+
+    def detailed_repr(self) -> str:
+        """Get a detailed representation including all settings."""
+        # Only needed for diagnostics, so imported on use
+        from pyweaver.utils.repr import comprehensive_repr
+
         return comprehensive_repr(
             self,
             prioritize=["global_settings", "path_specific"],
@@ -22,7 +22,6 @@ Path: pyweaver/config/path.py
 import logging
 from pathlib import Path
 from typing import Dict, Set, Any, Optional, List, Union
-from functools import lru_cache
 from pydantic import BaseModel, Field, field_validator
 
 from pyweaver.config.base import BaseConfig, ConfigValidationModel
@@ -192,7 +191,6 @@ class PathConfig(BaseConfig[PathSettings]):
         try:
             super().__init__(global_settings, path_specific)
             self.pattern_matcher = pattern_matcher or PatternMatcher()
-            self._settings_cache: Dict[Path, PathSettings] = {}
 
             logger.debug(
                 "Initialized PathConfig with %d path-specific settings",
@@ -217,25 +215,33 @@ class PathConfig(BaseConfig[PathSettings]):
     def matches_any_pattern(self, path: Path | str, patterns: Set[str]) -> bool:
         """Check if a path matches any of the given patterns.
 
-        This method provides efficient pattern matching with caching for
-        improved performance on repeated operations.
+        All patterns are compiled into a single regex (cached per pattern
+        set), so each path is scanned once regardless of pattern count.
 
         Args:
             path: Path to check
             patterns: Set of patterns to match against
 
         Returns:
-            True if path matches any pattern
+            True if path matches any pattern (never for an empty set)
         """
+        if not patterns:
+            return False
+
         try:
             # Normalize path for consistent matching
             path_str = str(path).replace('\\', '/')
 
-            # Check each pattern with caching
-            return any(
-                self._match_pattern_cached(path_str, pattern)
-                for pattern in patterns
-            )
+            try:
+                regex = self.pattern_matcher.compile_path_patterns(patterns)
+            except ValidationError:
+                # Let valid patterns still match when one is invalid
+                return any(
+                    self.pattern_matcher.matches_path_pattern(path_str, pattern)
+                    for pattern in patterns
+                )
+
+            return regex.search(path_str) is not None
 
         except Exception as e:
             logger.warning(
@@ -263,7 +269,7 @@ class PathConfig(BaseConfig[PathSettings]):
             ConfigError: If validation fails
         """
         try:
-            return ConfigValidationModel[PathSettings](**config_data)
+            return self._validation_model(**config_data)
         except Exception as e:
             context = ErrorContext(
                 operation="validate_config",
@@ -301,8 +307,8 @@ class PathConfig(BaseConfig[PathSettings]):
             return base.model_copy()
 
         try:
-            # Create new settings with merged values
-            return PathSettings(
+            # Inputs are already validated, so skip re-validation
+            return PathSettings.model_construct(
                 ignore_patterns=base.ignore_patterns | path_settings.ignore_patterns,
                 include_patterns=base.include_patterns | path_settings.include_patterns,
                 additional_options={
@@ -326,37 +332,13 @@ class PathConfig(BaseConfig[PathSettings]):
                 original_error=e
             ) from e
 
-    @lru_cache(maxsize=1000)
-    def _match_pattern_cached(self, path: str, pattern: str) -> bool:
-        """Cached pattern matching for improved performance.
-
-        This method caches pattern matching results to improve performance
-        for frequently checked paths and patterns.
-
-        Args:
-            path: Normalized path string
-            pattern: Pattern to match against
-
-        Returns:
-            True if path matches pattern
-        """
-        try:
-            return self.pattern_matcher.matches_path_pattern(path, pattern)
-        except Exception as e:
-            logger.warning(
-                "Pattern matching failed: %s vs %s: %s",
-                path, pattern, e
-            )
-            return False
-
     def clear_cache(self) -> None:
         """Clear all caches to ensure fresh pattern matching.
 
         This method should be called when configuration changes or when
         memory needs to be freed.
         """
-        self._settings_cache.clear()
-        self._match_pattern_cached.cache_clear()
+        self._settings_cache.cache_clear()
         logger.debug("Cleared path configuration caches")
 
     def __repr__(self) -> str:
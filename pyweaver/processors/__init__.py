@@ -39,23 +39,58 @@ Example:
 Path: pyweaver/processors/__init__.py
 """
 
-from .structure_generator import (
-    SortOrder,
-    StructureOptions,
-    EntryInfo,
-    StructurePrinter,
-    generate_structure
-)
-from .file_combiner import (
-    CombinerProgress,
-    FileCombinerProcessor,
-    combine_files
-)
-from .init_processor import (
-    InitFileProgress,
-    InitFileProcessor,
-    generate_init_files
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> defining submodule. Each processor (and its config and
+# analysis dependencies) is imported on first attribute access (PEP 562).
+_LAZY_IMPORTS = {
+    'SortOrder': 'structure_generator',
+    'StructureOptions': 'structure_generator',
+    'EntryInfo': 'structure_generator',
+    'StructurePrinter': 'structure_generator',
+    'generate_structure': 'structure_generator',
+
+    'CombinerProgress': 'file_combiner',
+    'FileCombinerProcessor': 'file_combiner',
+    'combine_files': 'file_combiner',
+
+    'InitFileProgress': 'init_processor',
+    'InitFileProcessor': 'init_processor',
+    'generate_init_files': 'init_processor'
+}
+
+if TYPE_CHECKING:
+    from .structure_generator import (
+        SortOrder,
+        StructureOptions,
+        EntryInfo,
+        StructurePrinter,
+        generate_structure
+    )
+    from .file_combiner import (
+        CombinerProgress,
+        FileCombinerProcessor,
+        combine_files
+    )
+    from .init_processor import (
+        InitFileProgress,
+        InitFileProcessor,
+        generate_init_files
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 __all__ = [
     'SortOrder',
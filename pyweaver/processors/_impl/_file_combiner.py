@@ -13,11 +13,14 @@ The implementation provides:
 Path: pyweaver/processors/_impl/_file_combiner.py
 """
 import ast
+import io
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Set
 import re
 import time
+import tokenize
 from dataclasses import dataclass
 
 from pyweaver.config.combiner import CombinerConfig, ContentMode
@@ -30,7 +33,92 @@ from pyweaver.common.errors import (
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Content modes that strip each kind of content, resolved once at import
+_STRIP_DOCSTRING_MODES = frozenset({ContentMode.NO_DOCSTRINGS, ContentMode.MINIMAL})
+_STRIP_COMMENT_MODES = frozenset({ContentMode.NO_COMMENTS, ContentMode.MINIMAL})
+
+# Write buffer for combined output, so streamed parts reach disk in large blocks
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# C-style comment scanners. Each match is either a whole-line comment
+# (group "line", consumed with its line break), a string literal (group
+# "string", always kept) or an inline comment with its leading blanks
+# (group "comment"). Block comment bodies cannot contain "*/". Strings are
+# matched from their opening quote, so comment markers inside them are safe.
+_C_BLOCK_COMMENT = r'/\*(?:[^*]|\*(?!/))*\*/'
+_C_LINE_COMMENT = r'//[^\n]*'
+_QUOTED_STRINGS = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+_JS_TOKEN_RE = re.compile(
+    rf'^(?P<line>[ \t]*(?:{_C_BLOCK_COMMENT}|{_C_LINE_COMMENT})[ \t]*(?:\n|\Z))'
+    rf'|(?P<string>{_QUOTED_STRINGS}|`(?:\\.|[^`\\])*`)'
+    rf'|(?P<comment>[ \t]*(?:{_C_BLOCK_COMMENT}|{_C_LINE_COMMENT}))',
+    re.MULTILINE
+)
+_STYLE_TOKEN_RE = re.compile(
+    rf'^(?P<line>[ \t]*(?:{_C_BLOCK_COMMENT}|{_C_LINE_COMMENT})[ \t]*(?:\n|\Z))'
+    rf'|(?P<string>{_QUOTED_STRINGS})'
+    rf'|(?P<comment>[ \t]*(?:{_C_BLOCK_COMMENT}|{_C_LINE_COMMENT}))',
+    re.MULTILINE
+)
+
+def _strip_c_style_comments(
+    token_re: Pattern,
+    content: str,
+    strip_docs: bool,
+    strip_comments: bool
+) -> str:
+    """Remove C-style comments in a single regex pass.
+
+    Doc comments (``/** ... */``) and ordinary comments are controlled
+    separately. Comments that fill whole lines are removed with their line.
+
+    Args:
+        token_re: Scanner matching comments and string literals
+        content: Source text
+        strip_docs: Whether to remove doc comments
+        strip_comments: Whether to remove ordinary comments
+
+    Returns:
+        Source text without the selected comments
+    """
+    if not (strip_docs or strip_comments):
+        return content
+
+    def replace(match: re.Match) -> str:
+        if match.lastgroup == 'string':
+            return match.group()
+        text = match.group().lstrip()
+        is_doc = text.startswith('/**') and not text.startswith('/**/')
+        return '' if (strip_docs if is_doc else strip_comments) else match.group()
+
+    return token_re.sub(replace, content)
+
+# Line breaks as Python source counts them; str.splitlines also breaks on
+# form feeds and other separators, which would shift ast/tokenize numbering
+_LINE_BREAK_RE = re.compile(r'\r\n|\r|\n')
+_LINE_WITH_END_RE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z')
+
+def _source_lines(content: str, keepends: bool = False) -> List[str]:
+    """Split Python source into lines numbered like ast and tokenize.
+
+    Args:
+        content: Python source
+        keepends: Whether to keep each line's line break
+
+    Returns:
+        Source lines
+    """
+    if keepends:
+        return _LINE_WITH_END_RE.findall(content)
+    lines = _LINE_BREAK_RE.split(content)
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+# AST nodes whose first statement may be a docstring
+_DOCSTRING_OWNERS = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+@dataclass(frozen=True, slots=True)
 class ProcessedContent:
     """Information about processed file content.
 
@@ -43,12 +131,14 @@ class ProcessedContent:
         processed_size: Size after processing
         line_count: Number of lines in processed content
         processing_time: Time taken to process
+        original_lines: Number of lines in original content
     """
     content: str
     original_size: int
     processed_size: int
     line_count: int
     processing_time: float
+    original_lines: int = 0
 
 class FileProcessor:
     """Base class for file type specific processors.
@@ -75,24 +165,45 @@ class FileProcessor:
         raise NotImplementedError
 
 class PythonProcessor(FileProcessor):
-    """Content processor for Python files."""
+    """Content processor for Python files.
+
+    Docstrings are located with ast and comments with tokenize, and only
+    those source lines are dropped or trimmed; all other source text is
+    kept verbatim.
+    """
 
     def _process_content(self, content: str, mode: ContentMode) -> str:
         """Process Python content with docstring and comment handling."""
         try:
-            # Handle docstrings if needed
-            if mode in {ContentMode.NO_DOCSTRINGS, ContentMode.MINIMAL}:
+            strip_docstrings = mode in _STRIP_DOCSTRING_MODES
+            strip_comments = mode in _STRIP_COMMENT_MODES
+
+            # Lines to drop (0-based) and lines replaced by a placeholder
+            removed: Set[int] = set()
+            replaced: Dict[int, str] = {}
+            if strip_docstrings:
                 try:
                     tree = ast.parse(content)
-                    content = self._remove_docstrings(tree)
                 except SyntaxError:
+                    # Fall back to line heuristics for unparseable source
                     content = self._remove_docstrings_basic(content)
+                else:
+                    lines = _source_lines(content, keepends=True)
+                    self._collect_docstring_lines(tree, lines, removed, replaced)
 
-            # Handle comments if needed
-            if mode in {ContentMode.NO_COMMENTS, ContentMode.MINIMAL}:
-                content = self._remove_comments(content)
+            # Comment start column (in characters) per 0-based line
+            comments: Dict[int, int] = {}
+            if strip_comments:
+                try:
+                    comments = self._find_comments(content)
+                except (tokenize.TokenError, SyntaxError):
+                    if removed or replaced:
+                        content = self._drop_lines(content, removed, replaced, {})
+                    return self._remove_comments(content)
 
-            return content
+            if not (removed or replaced or comments):
+                return content
+            return self._drop_lines(content, removed, replaced, comments)
 
         except Exception as e:
             context = ErrorContext(
@@ -106,64 +217,102 @@ class PythonProcessor(FileProcessor):
                 original_error=e
             ) from e
 
-    def _remove_docstrings(self, tree: ast.AST) -> str:
-        """Remove docstrings from Python AST nodes.
+    @staticmethod
+    def _collect_docstring_lines(
+        tree: ast.AST,
+        lines: List[str],
+        removed: Set[int],
+        replaced: Dict[int, str]
+    ) -> None:
+        """Find the source lines occupied by docstrings.
+
+        A docstring is only removed when it sits on lines of its own. If it
+        is the only statement in a class or function body, its first line
+        is replaced with ``pass`` so the body stays valid.
+
+        Args:
+            tree: Parsed module
+            lines: Source lines, with line endings
+            removed: Receives 0-based indexes of lines to drop
+            replaced: Receives 0-based line indexes mapped to replacement text
+        """
+        for node in ast.walk(tree):
+            if not isinstance(node, _DOCSTRING_OWNERS) or not node.body:
+                continue
+            first = node.body[0]
+            if not (isinstance(first, ast.Expr)
+                    and isinstance(first.value, ast.Constant)
+                    and isinstance(first.value.value, str)):
+                continue
+
+            start, end = first.lineno - 1, first.end_lineno - 1
+            # ast column offsets are UTF-8 byte offsets
+            before = lines[start].encode('utf-8')[:first.col_offset]
+            after = lines[end].encode('utf-8')[first.end_col_offset:]
+            if before.strip() or (after.strip() and not after.lstrip().startswith(b'#')):
+                continue
+
+            removed.update(range(start, end + 1))
+            if len(node.body) == 1 and not isinstance(node, ast.Module):
+                removed.discard(start)
+                replaced[start] = before.decode('utf-8') + 'pass\n'
+
+    @staticmethod
+    def _find_comments(content: str) -> Dict[int, int]:
+        """Locate comments with the tokenizer.
+
+        Args:
+            content: Python source
+
+        Returns:
+            Mapping of 0-based line index to the comment's start column
+
+        Raises:
+            tokenize.TokenError: If the source cannot be tokenized
+            SyntaxError: If the source has invalid indentation
+        """
+        return {
+            token.start[0] - 1: token.start[1]
+            for token in tokenize.generate_tokens(
+                io.StringIO(content, newline=None).readline
+            )
+            if token.type == tokenize.COMMENT
+        }
+
+    @staticmethod
+    def _drop_lines(
+        content: str,
+        removed: Set[int],
+        replaced: Dict[int, str],
+        comments: Dict[int, int]
+    ) -> str:
+        """Rebuild source without removed lines and comments.
+
+        Lines left empty once their comment is cut are dropped entirely.
 
         Args:
-            tree (ast.AST): The Abstract Syntax Tree to process.
+            content: Original source
+            removed: 0-based indexes of lines to drop
+            replaced: 0-based line indexes mapped to replacement text
+            comments: 0-based line index mapped to comment start column
 
         Returns:
-            str: The source code with docstrings removed.
+            Rebuilt source
         """
-        class DocstringRemover(ast.NodeTransformer):
-            """AST transformer that removes docstrings from Python code.
-
-            Inherits from ast.NodeTransformer to traverse and modify the AST.
-            """
-            def visit_Module(self, node):
-                """Remove module-level docstrings.
-
-                Args:
-                    node (ast.Module): The module node to process.
-
-                Returns:
-                    ast.Module: The processed module node.
-                """
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant)):
-                    node.body.pop(0)
-                return node
-
-            def visit_ClassDef(self, node):
-                """Remove class-level docstrings.
-
-                Args:
-                    node (ast.ClassDef): The class definition node to process.
-
-                Returns:
-                    ast.ClassDef: The processed class node.
-                """
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant)):
-                    node.body.pop(0)
-                return node
-
-            def visit_FunctionDef(self, node):
-                """Remove function-level docstrings.
-
-                Args:
-                    node (ast.FunctionDef): The function definition node to process.
-
-                Returns:
-                    ast.FunctionDef: The processed function node.
-                """
-                if (node.body and isinstance(node.body[0], ast.Expr) and
-                    isinstance(node.body[0].value, ast.Constant)):
-                    node.body.pop(0)
-                return node
-
-        tree = DocstringRemover().visit(tree)
-        return ast.unparse(tree)
+        out = []
+        for index, line in enumerate(_source_lines(content)):
+            if index in removed:
+                continue
+            if index in replaced:
+                out.append(replaced[index].rstrip('\n'))
+                continue
+            column = comments.get(index)
+            if column is not None:
+                line = line[:column].rstrip()
+                if not line:
+                    continue
+            out.append(line)
+        return '\n'.join(out)
 
     def _remove_docstrings_basic(self, content: str) -> str:
         """Remove docstrings using basic parsing."""
@@ -225,53 +374,13 @@ class JavaScriptProcessor(FileProcessor):
 
     def _process_content(self, content: str, mode: ContentMode) -> str:
         """Process JavaScript content with JSDoc and comment handling."""
-        if mode == ContentMode.FULL:
-            return content
-
-        lines = []
-        in_multiline = False
-        in_jsdoc = False
-        in_string = False
-        string_char = None
-
         try:
-            for line in content.splitlines():
-                if not in_multiline and not in_jsdoc:
-                    processed_line = ''
-                    i = 0
-                    while i < len(line):
-                        if not in_string:
-                            if line[i:i+2] == '/*':
-                                if line[i:i+3] == '/**':
-                                    if mode in {ContentMode.NO_DOCSTRINGS, ContentMode.MINIMAL}:
-                                        in_jsdoc = True
-                                        break
-                                in_multiline = True
-                                break
-                            elif line[i:i+2] == '//' and not in_string:
-                                processed_line += line[:i].rstrip()
-                                break
-                            elif line[i] in '"\'`':
-                                in_string = True
-                                string_char = line[i]
-                        else:
-                            if line[i] == string_char and line[i-1] != '\\':
-                                in_string = False
-
-                        processed_line += line[i]
-                        i += 1
-
-                    if processed_line or not line.strip():
-                        lines.append(processed_line)
-                else:
-                    if '*/' in line:
-                        in_multiline = False
-                        in_jsdoc = False
-                        after_comment = line.split('*/')[-1].lstrip()
-                        if after_comment:
-                            lines.append(after_comment)
-
-            return '\n'.join(lines)
+            return _strip_c_style_comments(
+                _JS_TOKEN_RE,
+                content,
+                strip_docs=mode in _STRIP_DOCSTRING_MODES,
+                strip_comments=mode in _STRIP_COMMENT_MODES
+            )
 
         except Exception as e:
             context = ErrorContext(
@@ -291,17 +400,15 @@ class StyleProcessor(FileProcessor):
     def _process_content(self, content: str, mode: ContentMode) -> str:
         """Process style content, handling comments appropriately."""
         try:
-            if mode == ContentMode.FULL:
+            if mode not in _STRIP_COMMENT_MODES:
                 return content
 
-            if mode in {ContentMode.NO_COMMENTS, ContentMode.MINIMAL}:
-                # Remove multi-line comments while preserving content
-                content = re.sub(r'/\*[\s\S]*?\*/', '', content)
-
-                # Remove single-line comments
-                content = re.sub(r'//.*$', '', content, flags=re.MULTILINE)
-
-            return content
+            return _strip_c_style_comments(
+                _STYLE_TOKEN_RE,
+                content,
+                strip_docs=True,
+                strip_comments=True
+            )
 
         except Exception as e:
             context = ErrorContext(
@@ -324,7 +431,7 @@ class HTMLProcessor(FileProcessor):
             if mode == ContentMode.FULL:
                 return content
 
-            if mode in {ContentMode.NO_COMMENTS, ContentMode.MINIMAL}:
+            if mode in _STRIP_COMMENT_MODES:
                 # Remove HTML comments while preserving conditional comments
                 content = re.sub(
                     r'<!--(?!.*?[\[<].*?>).*?-->',
@@ -432,17 +539,30 @@ class FileCombinerImpl:
             '.vue': VueProcessor()
         }
 
+        # Bind each processor to the content mode once. FULL mode keeps
+        # content as-is, so no handlers are needed at all.
+        mode = config.content_mode
+        self._handlers: Dict[str, Callable[[str], str]] = (
+            {} if mode == ContentMode.FULL else {
+                file_type: partial(processor.process, mode=mode)
+                for file_type, processor in self._processors.items()
+            }
+        )
+
         logger.debug(
             "Initialized combiner implementation with %d processors",
             len(self._processors)
         )
 
-    def process_file(self, path: Path) -> None:
+    def process_file(self, path: Path) -> ProcessedContent:
         """Process a single file's content.
 
         Args:
             path: Path to file to process
 
+        Returns:
+            Details of the processed content
+
         Raises:
             FileError: If file cannot be read or processed
             ProcessingError: If content processing fails
@@ -453,6 +573,7 @@ class FileCombinerImpl:
             # Read content
             content = self._read_file(path)
             original_size = len(content)
+            original_lines = len(content.splitlines())
 
             # Process content
             processed = self._process_content(content, path.suffix)
@@ -482,36 +603,37 @@ class FileCombinerImpl:
             header = self.config.section_config.format_header(
                 rel_path,
                 size=len(content),
-                lines=len(content.splitlines())
+                lines=original_lines
             )
 
+            line_count = len(processed.splitlines())
             footer = self.config.section_config.format_footer(
                 rel_path,
                 size=len(processed),
-                lines=len(processed.splitlines())
+                lines=line_count
             )
 
             # Store processing results
             processing_time = time.time() - start_time
-            self._processed_files[path] = ProcessedContent(
+            result = ProcessedContent(
                 content=processed,
                 original_size=original_size,
                 processed_size=len(processed),
-                line_count=len(processed.splitlines()),
-                processing_time=processing_time
+                line_count=line_count,
+                processing_time=processing_time,
+                original_lines=original_lines
             )
+            self._processed_files[path] = result
 
-            # Add to combined content
-            self._combined_content.extend([
-                header,
-                processed,
-                footer
-            ])
+            # Add to combined content as one section, so output joins and
+            # writes handle a single part per file
+            self._combined_content.append(f"{header}\n{processed}\n{footer}")
 
             logger.debug(
                 "Processed %s (original: %d bytes, processed: %d bytes, time: %.2fs)",
                 rel_path, original_size, len(processed), processing_time
             )
+            return result
 
         except Exception as e:
             context = ErrorContext(
@@ -529,44 +651,55 @@ class FileCombinerImpl:
                 original_error=e
             ) from e
 
-    def write_output(self) -> None:
+    def write_output(self, output_path: Optional[Path] = None) -> None:
         """Write combined output to file.
 
         This method generates and writes the final combined output,
         including any requested structure information or statistics.
+        The output is streamed part by part, so the complete combined
+        text is never held in memory at once.
+
+        Args:
+            output_path: Where to write (defaults to the configured output file)
 
         Raises:
             FileError: If writing fails
         """
+        output_path = output_path or self.config.output_file
         try:
             # Create output directory if needed
-            self.config.output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Generate complete output content
-            output = self._generate_output()
-
-            # Write final content
-            self.config.output_file.write_text(
-                output,
-                encoding=self.config.encoding
-            )
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            parts = (self._iter_output() if self._combined_content
+                     else iter(["No files processed yet"]))
+
+            # Stream output parts instead of joining them into one string
+            written = 0
+            with open(output_path, 'w', encoding=self.config.encoding,
+                      buffering=_OUTPUT_BUFFER_SIZE) as f:
+                for index, part in enumerate(parts):
+                    if index:
+                        f.write('\n')
+                        written += 1
+                    f.write(part)
+                    written += len(part)
 
             logger.info(
                 "Wrote combined output to %s (%d bytes)",
-                self.config.output_file,
-                len(output)
+                output_path,
+                written
             )
 
         except Exception as e:
             context = ErrorContext(
                 operation="write_output",
                 error_code=ErrorCode.FILE_WRITE,
-                path=self.config.output_file,
+                path=output_path,
                 details={"encoding": self.config.encoding}
             )
             raise FileError(
                 "Failed to write output file",
-                path=self.config.output_file,
+                path=output_path,
                 context=context,
                 original_error=e
             ) from e
@@ -616,34 +749,19 @@ class FileCombinerImpl:
             if not self._processed_files:
                 return "No files processed"
 
-            def build_tree(paths: List[Path], prefix: str = "") -> List[str]:
-                """Build tree structure recursively."""
-                if not paths:
-                    return []
-
-                tree = []
-                for i, path in enumerate(sorted(paths)):
-                    is_last = i == len(paths) - 1
-                    connector = "└── " if is_last else "├── "
-                    tree.append(f"{prefix}{connector}{path.name}")
-
-                    # Process children
-                    children = [p for p in paths if p.parent == path]
-                    if children:
-                        ext_prefix = "    " if is_last else "│   "
-                        tree.extend(build_tree(children, prefix + ext_prefix))
-
-                return tree
-
             paths = [Path(file.relative_to(self.root_dir))
                     for file in self._processed_files]
 
-            return "\n".join([
-                "# Project Structure",
-                f"# Total files: {len(paths)}",
-                "",
-                *build_tree(paths)
-            ])
+            # Only files are processed, so no entry has children and the
+            # tree is a single sorted level
+            paths.sort()
+            tree = ["# Project Structure", f"# Total files: {len(paths)}", ""]
+            last = len(paths) - 1
+            for i, path in enumerate(paths):
+                connector = "└── " if i == last else "├── "
+                tree.append(f"{connector}{path.name}")
+
+            return "\n".join(tree)
 
         except Exception as e:
             context = ErrorContext(
@@ -690,7 +808,8 @@ class FileCombinerImpl:
         """Process content according to file type and configuration.
 
         This method applies the appropriate processing strategy based on
-        the file type and configured content mode.
+        the file type and the content mode the implementation was created
+        with.
 
         Args:
             content: Raw file content
@@ -703,16 +822,12 @@ class FileCombinerImpl:
             ProcessingError: If processing fails
         """
         try:
-            # Get appropriate processor
-            processor: FileProcessor = self._processors.get(file_type.lower())
-            if processor is None:
-                logger.debug(
-                    "No specific processor for %s, using raw content",
-                    file_type
-                )
+            # Get the handler bound to the configured mode
+            handler = self._handlers.get(file_type.lower())
+            if handler is None:
                 return content
 
-            return processor.process(content, self.config.content_mode)
+            return handler(content)
 
         except Exception as e:
             context = ErrorContext(
@@ -738,6 +853,14 @@ class FileCombinerImpl:
         Returns:
             Complete output content
         """
+        return '\n'.join(self._iter_output())
+
+    def _iter_output(self) -> Iterator[str]:
+        """Yield the parts of the combined output, to be joined by newlines.
+
+        Yields:
+            Structure, statistics and file section parts in output order
+        """
         output = []
 
         # Add file structure if requested
@@ -776,7 +899,7 @@ class FileCombinerImpl:
             ]
             output.extend(stats)
 
-        # Add combined content
-        output.extend(self._combined_content)
+        yield from output
 
-        return '\n'.join(output)
\ No newline at end of file
+        # Combined content is yielded as stored, without copying
+        yield from self._combined_content
\ No newline at end of file
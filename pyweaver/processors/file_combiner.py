@@ -16,6 +16,7 @@ Features include:
 Path: pyweaver/processors/file_combiner.py
 """
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
@@ -138,6 +139,9 @@ class FileCombinerProcessor(BaseProcessor):
 
             # Initialize specialized components
             self.root_dir = Path(root_dir).resolve()
+            # Root as a string ending in a separator, for slicing out
+            # relative paths without Path.relative_to
+            self._root_prefix = os.path.join(os.fspath(self.root_dir), '')
             self.pattern_matcher = PatternMatcher()
             self._impl: Optional[FileCombinerImpl] = None
 
@@ -248,12 +252,11 @@ class FileCombinerProcessor(BaseProcessor):
         """
         try:
             self._ensure_impl()
-            self._impl.process_file(path)
+            result = self._impl.process_file(path)
 
-            # Update progress
+            # Update progress from the content already read
             self.progress.bytes_processed += path.stat().st_size
-            with path.open() as f:
-                self.progress.lines_processed += sum(1 for _ in f)
+            self.progress.lines_processed += result.original_lines
 
         except Exception as e:
             context = ErrorContext(
@@ -282,22 +285,39 @@ class FileCombinerProcessor(BaseProcessor):
         if not path.is_file():
             return False
 
-        rel_path = str(path.relative_to(self.root_dir))
+        rel_path = self._relative_posix(path)
 
-        # Check file patterns
-        matches_pattern = any(
-            self.pattern_matcher.matches_path_pattern(path=rel_path, pattern=pattern)
-            for pattern in self.config.file_patterns
-        )
-
-        if not matches_pattern:
+        # Check file patterns with one search of the combined regex
+        file_patterns = self.config.compiled_file_patterns
+        if file_patterns is None or not file_patterns.search(rel_path):
             return False
 
-        # Check ignore patterns
-        return not any(
-            self.pattern_matcher.matches_path_pattern(path=rel_path, pattern=pattern)
-            for pattern in self.config.global_settings.ignore_patterns
+        # Check ignore patterns, likewise combined into one regex
+        ignore_patterns = self.pattern_matcher.compile_path_patterns(
+            self.config.global_settings.ignore_patterns
         )
+        return ignore_patterns is None or not ignore_patterns.search(rel_path)
+
+    def _relative_posix(self, path: Path) -> str:
+        """Get a path relative to the root directory with forward slashes.
+
+        Paths under the root are sliced from their string form; anything
+        else goes through Path.relative_to.
+
+        Args:
+            path: Path under the root directory
+
+        Returns:
+            Relative path string using '/' separators
+
+        Raises:
+            ValueError: If path is not under the root directory
+        """
+        path_str = os.fspath(path)
+        if path_str.startswith(self._root_prefix):
+            rel_path = path_str[len(self._root_prefix):]
+            return rel_path if os.sep == '/' else rel_path.replace(os.sep, '/')
+        return path.relative_to(self.root_dir).as_posix()
 
     def _ensure_impl(self) -> None:
         """Ensure implementation component is initialized.
@@ -324,8 +344,7 @@ class FileCombinerProcessor(BaseProcessor):
         Implements BaseProcessor._write_output() for file combining.
         """
         try:
-            content = self._impl.preview_output()
-            path.write_text(content, encoding=self.config.encoding)
+            self._impl.write_output(path)
         except Exception as e:
             raise FileError(
                 f"Failed to write combined output: {e}",
@@ -15,8 +15,9 @@ The module implements:
 Path: pyweaver/processors/init_processor.py
 """
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional, Set, List, Any, Union
+from typing import Dict, Iterator, Optional, Set, List, Any, Tuple, Union
 from dataclasses import dataclass
 
 from pyweaver.common.base import BaseProcessor, ProcessorProgress, ProcessorResult
@@ -31,6 +32,39 @@ from pyweaver.utils.repr import comprehensive_repr
 
 logger = logging.getLogger(__name__)
 
+def _iter_python_dirs(root: Path) -> Iterator[Tuple[Path, List[str]]]:
+    """Walk a tree and yield each directory that contains Python files.
+
+    Entry types come from the directory listing, so no per-entry stat is
+    needed. Directories are visited depth-first in listing order, and
+    symlinked directories are not followed.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Tuples of directory path and the names of its .py files
+    """
+    stack = [root]
+    while stack:
+        dir_path = stack.pop()
+        py_names = []
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        py_names.append(entry.name)
+        except OSError as e:
+            logger.warning("Cannot scan directory %s: %s", dir_path, e)
+            continue
+
+        if py_names:
+            yield dir_path, py_names
+        stack.extend(dir_path / name for name in reversed(subdirs))
+
 @dataclass
 class InitFileProgress(ProcessorProgress):
     """Extended progress tracking for init file generation.
@@ -84,7 +118,8 @@ class InitFileProcessor(BaseProcessor):
         self,
         root_dir: str | Path,
         config_path: Optional[str | Path] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        max_workers: Optional[int] = None
     ):
         """Initialize the init file processor.
 
@@ -92,6 +127,8 @@ class InitFileProcessor(BaseProcessor):
             root_dir: Root directory to process
             config_path: Optional path to init_config.json
             dry_run: If True, don't write any files
+            max_workers: Optional number of processes for module analysis;
+                defaults to the CPU count, and 1 analyzes in-process
 
         Raises:
             ValidationError: If configuration is invalid
@@ -120,6 +157,7 @@ class InitFileProcessor(BaseProcessor):
 
             self.pattern_matcher = self.init_config.pattern_matcher
             self.dry_run = dry_run
+            self.max_workers = max_workers
             self.module_analyzer = ModuleAnalyzer()
 
             # Replace standard progress with specialized version
@@ -128,6 +166,9 @@ class InitFileProcessor(BaseProcessor):
             # Storage for generated content
             self._changes: Dict[Path, str] = {}
 
+            # Module analysis for the current scan, parsed in one batch
+            self._analyzed: Dict[Path, ModuleInfo] = {}
+
             logger.info(
                 "Initialized InitFileProcessor for %s (dry_run=%s)",
                 self.root_dir, dry_run
@@ -229,6 +270,7 @@ class InitFileProcessor(BaseProcessor):
             # Clear previous state
             self.tracker.cleanup()
             self._changes.clear()
+            self._analyzed.clear()
 
             logger.info("Starting project scan from: %s", self.root_dir)
 
@@ -239,24 +281,38 @@ class InitFileProcessor(BaseProcessor):
             total_files = 0
             excluded_files = 0
             excluded_paths = []
+            module_files = []
 
             # Scan for Python files to identify package directories
-            for path in self.root_dir.rglob("*.py"):
-                total_files += 1
-                if path.name == "__init__.py":
+            for dir_path, py_names in _iter_python_dirs(self.root_dir):
+                total_files += len(py_names)
+                module_count = sum(1 for name in py_names if name != "__init__.py")
+                if not module_count:
                     continue
 
-                dir_path = path.parent
-                rel_path = dir_path.relative_to(self.root_dir)
-
+                # Exclusion depends only on the directory, so check it once
                 if not self.init_config.pattern_matcher.is_excluded_path(dir_path):
-                    self.tracker.add_pending(dir_path)
+                    self.tracker.add_pending(dir_path, is_dir=True)
+                    module_files.extend(
+                        dir_path / name for name in py_names
+                        if name != "__init__.py"
+                    )
                     logger.debug("Added directory to pending: %s", dir_path)
                 else:
-                    excluded_files += 1
-                    excluded_paths.append(str(rel_path))
+                    excluded_files += module_count
+                    excluded_paths.append(str(dir_path.relative_to(self.root_dir)))
                     logger.debug("Excluded directory: %s", dir_path)
 
+            # Analyze every module in one batch, so a single process pool
+            # serves the whole run. Failures are left to _process_item,
+            # which reports them against their directory.
+            self._analyzed = self.module_analyzer.analyze_files(
+                module_files,
+                str(self.root_dir.name),
+                max_workers=self.max_workers,
+                skip_errors=True
+            )
+
             # Update progress tracking
             self.progress.total_items = self.tracker.get_stats().total
 
@@ -393,12 +449,12 @@ class InitFileProcessor(BaseProcessor):
         try:
             module_info = {}
 
-            # Process Python files
+            # Process Python files, reusing the results of the scan batch
             for py_file in dir_path.glob("*.py"):
                 if py_file.name == "__init__.py":
                     continue
 
-                info = self.module_analyzer.analyze_file(
+                info = self._analyzed.get(py_file) or self.module_analyzer.analyze_file(
                     py_file,
                     str(self.root_dir.name)
                 )
@@ -680,7 +736,8 @@ def generate_init_files(
     exports_blacklist: Optional[Set[str]] = None,
     sections: Optional[Dict[str, Any]] = None,
     exact_path_only: bool = False,
-    export_mode: Optional[str] = None
+    export_mode: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[Path, str]:
     """Generate or update __init__.py files across a project.
 
@@ -704,6 +761,7 @@ def generate_init_files(
         sections: Dictionary of section configurations
         exact_path_only: Whether to use exact path matching
         export_mode: How to determine exports
+        max_workers: Processes for module analysis; 1 analyzes in-process
 
     Returns:
         Dictionary mapping file paths to their content (if preview=True)
@@ -735,38 +793,44 @@ def generate_init_files(
         processor = InitFileProcessor(
             root_dir=root_dir,
             config_path=config_path,
-            dry_run=preview
+            dry_run=preview,
+            max_workers=max_workers
         )
 
-        # Update configuration with provided settings
+        # Update configuration with provided settings. The settings are
+        # replaced rather than mutated, since merged settings may share
+        # them and the setter invalidates cached lookups.
         settings = processor.init_config.global_settings
 
         # Base settings
-        settings.collect_from_submodules = collect_submodules
+        updates: Dict[str, Any] = {
+            "collect_from_submodules": collect_submodules,
+            "exact_path_only": exact_path_only
+        }
 
         if docstring is not None:
-            settings.docstring = docstring
+            updates["docstring"] = docstring
 
         if exclude_patterns:
-            settings.excluded_paths.update(exclude_patterns)
+            updates["excluded_paths"] = settings.excluded_paths | set(exclude_patterns)
 
         # Optional configuration settings
         if include_submodules is not None:
-            settings.include_submodules = include_submodules
+            updates["include_submodules"] = include_submodules
 
         if order_policy is not None:
-            settings.order_policy = order_policy
+            updates["order_policy"] = order_policy
 
         if exports_blacklist is not None:
-            settings.exports_blacklist = exports_blacklist
+            updates["exports_blacklist"] = exports_blacklist
 
         if sections is not None:
-            settings.sections = sections
-
-        settings.exact_path_only = exact_path_only
+            updates["sections"] = sections
 
         if export_mode is not None:
-            settings.export_mode = export_mode
+            updates["export_mode"] = export_mode
+
+        processor.init_config.global_settings = settings.model_copy(update=updates)
 
         # Process files
         # result = processor.process()
@@ -39,12 +39,16 @@ performance for large directory structures.
 
 Path: pyweaver/processors/structure.py
 """
+import fnmatch
 import logging
+import os
+import re
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
 import time
-from typing import List, Set, Any, Optional, Dict
+from typing import Callable, FrozenSet, List, Set, Any, Optional, Dict, Tuple
 
 from pyweaver.common.enums import ListingStyle
 from pyweaver.common.errors import (
@@ -53,7 +57,41 @@ from pyweaver.common.errors import (
 
 logger = logging.getLogger(__name__)
 
-class SortOrder(Enum):
+# Path.match compares case-insensitively on Windows
+_MATCH_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+
+# (pattern, compiled name matcher or None, literal prefix)
+PatternRule = Tuple[str, Optional[Callable[[str], Any]], str]
+
+@lru_cache(maxsize=4096)
+def _pattern_for(pattern: str) -> PatternRule:
+    """Compile a glob pattern into a shared matching rule.
+
+    Single-component patterns such as '*.pyc' only ever match the final
+    path component under Path.match, so they compile to a regex applied
+    to the entry name. Other patterns keep using Path.match.
+
+    Args:
+        pattern: Glob pattern to compile
+
+    Returns:
+        Matching rule for the pattern
+    """
+    name_match = None
+    if pattern:
+        pure = PurePath(pattern)
+        if len(pure.parts) == 1 and not pure.anchor:
+            name_match = re.compile(
+                fnmatch.translate(pure.parts[0]), _MATCH_FLAGS
+            ).match
+    return pattern, name_match, pattern.rstrip('*')
+
+@lru_cache(maxsize=256)
+def _compile_patterns(patterns: FrozenSet[str]) -> Tuple[PatternRule, ...]:
+    """Compile a set of glob patterns, sharing rules across identical sets."""
+    return tuple(_pattern_for(pattern) for pattern in patterns)
+
+class SortOrder(str, Enum):
     """Sort order for directory entries.
 
     This enum defines different ways to order directory entries in the output,
@@ -65,7 +103,7 @@ class SortOrder(Enum):
     MODIFIED = "modified"  # By modification time
     SIZE = "size"         # By file size
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StructureOptions:
     """Configuration for structure printing.
 
@@ -94,7 +132,7 @@ class StructureOptions:
     show_size: bool = False
     show_date: bool = False
     show_permissions: bool = False
-    ignore_patterns: Set[str] = field(default_factory=lambda: {
+    ignore_patterns: FrozenSet[str] = frozenset({
         '__pycache__',
         '.git',
         '.pytest_cache',
@@ -107,12 +145,12 @@ class StructureOptions:
         '.venv',
         'node_modules'
     })
-    include_patterns: Set[str] = field(default_factory=set)
+    include_patterns: FrozenSet[str] = frozenset()
     size_format: str = "auto"  # "bytes", "kb", "mb", "auto"
     date_format: str = "%Y-%m-%d %H:%M"
     max_name_length: Optional[int] = None
 
-@dataclass
+@dataclass(slots=True)
 class EntryInfo:
     """Information about a directory entry.
 
@@ -147,6 +185,11 @@ class TreeChars(str, Enum):
         """Return the actual character value."""
         return self.value
 
+# Plain strings for the tree formatter's per-entry loop
+_TREE_TEE = TreeChars.TEE.value
+_TREE_LAST = TreeChars.LAST.value
+_TREE_SPACE = TreeChars.SPACE.value
+
 class StructurePrinter:
     """Generates formatted directory structure listings.
 
@@ -210,8 +253,13 @@ class StructurePrinter:
             # Ensure UTF-8 encoding for tree characters
             self._ensure_encoding()
 
+            # Compiled pattern rules, refreshed at the start of each scan
+            self._ignore_rules: Tuple[PatternRule, ...] = ()
+            self._include_rules: Tuple[PatternRule, ...] = ()
+
             # Initialize tracking collections
             self._entries: Dict[Path, EntryInfo] = {}
+            self._children: Dict[Path, List[EntryInfo]] = {}
             self._errors: List[str] = []
 
             # Statistics
@@ -259,6 +307,11 @@ class StructurePrinter:
             self._total_dirs = 0
             self._total_size = 0
             self._entries.clear()
+            self._children.clear()
+
+            # Compile patterns once for the whole scan
+            self._ignore_rules = _compile_patterns(frozenset(self.options.ignore_patterns))
+            self._include_rules = _compile_patterns(frozenset(self.options.include_patterns))
 
             # Scan directory structure
             self._scan_directory(self.root_dir)
@@ -352,8 +405,14 @@ class StructurePrinter:
                 return
 
             try:
-                # Process directory entries
-                for item in path.iterdir():
+                # Process directory entries; scandir supplies each entry's
+                # type from the directory listing, saving a stat per entry.
+                # Entries are listed up front so the handle is closed
+                # before recursing.
+                with os.scandir(path) as entries:
+                    items = [(Path(entry.path), entry) for entry in entries]
+
+                for item, entry in items:
                     try:
                         # Check ignore patterns
                         if self._should_ignore(item):
@@ -362,13 +421,13 @@ class StructurePrinter:
                         # Collect entry information
                         info = EntryInfo(
                             path=item,
-                            is_dir=item.is_dir()
+                            is_dir=entry.is_dir()
                         )
 
                         if not info.is_dir:
                             # Collect file information
                             try:
-                                stat = item.stat()
+                                stat = entry.stat()
                                 info.size = stat.st_size
                                 info.modified = stat.st_mtime
                                 self._total_files += 1
@@ -379,6 +438,7 @@ class StructurePrinter:
                             self._total_dirs += 1
 
                         self._entries[item] = info
+                        self._children.setdefault(path, []).append(info)
 
                         # Recurse into directories
                         if info.is_dir:
@@ -430,12 +490,13 @@ class StructurePrinter:
             prefix = "" if i == 0 else "\n"
 
             # Add entry and its children
-            lines.extend(self._format_tree_entry(
+            self._format_tree_entry(
                 entry=entry,
                 prefix=prefix,
                 is_last=is_last,
-                indent_level=0
-            ))
+                indent_level=0,
+                lines=lines
+            )
 
         return "".join(lines)
 
@@ -444,26 +505,30 @@ class StructurePrinter:
         entry: EntryInfo,
         prefix: str,
         is_last: bool,
-        indent_level: int
+        indent_level: int,
+        lines: Optional[List[str]] = None
     ) -> List[str]:
         """Format a single entry in tree style.
 
         This method handles the formatting of individual entries in the
         tree structure, including proper indentation and branch characters.
+        Lines for the entry and all its descendants are appended to one
+        shared list rather than copied up through every level.
 
         Args:
             entry: Entry to format
             prefix: Prefix string (usually newline)
             is_last: Whether this is the last entry at this level
             indent_level: Current indentation level
+            lines: Optional list to append formatted lines to
 
         Returns:
             List of formatted lines
         """
-        lines = []
-        indent = TreeChars.SPACE.value * indent_level
-        # Ensure we use the actual unicode characters, not their names
-        line_prefix = f"{indent}{TreeChars.LAST.value if is_last else TreeChars.TEE.value}"
+        if lines is None:
+            lines = []
+        indent = _TREE_SPACE * indent_level
+        line_prefix = f"{indent}{_TREE_LAST if is_last else _TREE_TEE}"
 
         # Format entry name with optional information
         entry_text = self._format_entry_name(entry)
@@ -472,17 +537,15 @@ class StructurePrinter:
         # Process children if directory
         if entry.is_dir:
             children = self._get_sorted_entries(entry.path)
-            child_indent = (TreeChars.SPACE.value if is_last else
-                        f"{TreeChars.PIPE.value}   ")
-
+            last = len(children) - 1
             for i, child in enumerate(children):
-                child_lines = self._format_tree_entry(
+                self._format_tree_entry(
                     entry=child,
                     prefix="\n",
-                    is_last=i == len(children) - 1,
-                    indent_level=indent_level + 1
+                    is_last=i == last,
+                    indent_level=indent_level + 1,
+                    lines=lines
                 )
-                lines.extend(child_lines)
 
         return lines
 
@@ -717,11 +780,9 @@ class StructurePrinter:
         Returns:
             Sorted list of entry information
         """
-        # Collect entries for this directory
-        entries = [
-            entry for entry in self._entries.values()
-            if entry.path.parent.resolve() == directory.resolve()
-        ]
+        # Entries are grouped by directory during the scan, so each lookup
+        # is a dict hit rather than a pass over every scanned entry
+        entries = self._children.get(directory, [])
 
         # Create sort key function based on configuration
         key_funcs = {
@@ -750,19 +811,40 @@ class StructurePrinter:
         relative_path = str(path.resolve().relative_to(self.root_dir.resolve()))
 
         # Check include patterns first if specified
-        if self.options.include_patterns:
-            included = any(
-                path.match(pattern) or relative_path.startswith(pattern.rstrip('*'))
-                for pattern in self.options.include_patterns
-            )
-            if not included:
-                return True
+        if self._include_rules and not self._matches_any(
+            path, relative_path, self._include_rules
+        ):
+            return True
 
         # Check ignore patterns
-        return any(
-            path.match(pattern) or relative_path.startswith(pattern.rstrip('*'))
-            for pattern in self.options.ignore_patterns
-        )
+        return self._matches_any(path, relative_path, self._ignore_rules)
+
+    @staticmethod
+    def _matches_any(
+        path: Path,
+        relative_path: str,
+        rules: Tuple[PatternRule, ...]
+    ) -> bool:
+        """Check whether a path matches any compiled pattern rule.
+
+        Args:
+            path: Path to check
+            relative_path: Path relative to the root directory
+            rules: Compiled pattern rules
+
+        Returns:
+            True if any rule matches the path
+        """
+        name = path.name
+        for pattern, name_match, prefix in rules:
+            if name_match is not None:
+                if name_match(name):
+                    return True
+            elif path.match(pattern):
+                return True
+            if relative_path.startswith(prefix):
+                return True
+        return False
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the processed structure.
@@ -907,8 +989,8 @@ def generate_structure(
             show_size=show_size,
             show_date=show_date,
             max_depth=max_depth,
-            ignore_patterns=ignore_patterns or set(),
-            include_patterns=include_patterns or set(),
+            ignore_patterns=frozenset(ignore_patterns or ()),
+            include_patterns=frozenset(include_patterns or ()),
             show_permissions=show_permissions,
             size_format=size_format,
             date_format=date_format,
@@ -30,23 +30,56 @@ Example:
 Path: pyweaver/utils/__init__.py
 """
 
-from .module_analyzer import (
-    ImportInfo,
-    FunctionInfo,
-    ClassInfo,
-    ModuleInfo,
-    ModuleAnalyzer
-)
-
-from .patterns import (
-    PatternType,
-    PatternCache,
-    PatternMatcher
-)
-
-from .repr import (
-    comprehensive_repr
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> defining submodule, imported on first attribute access
+# (PEP 562) so using one utility does not load the others.
+_LAZY_IMPORTS = {
+    'ImportInfo': 'module_analyzer',
+    'FunctionInfo': 'module_analyzer',
+    'ClassInfo': 'module_analyzer',
+    'ModuleInfo': 'module_analyzer',
+    'ModuleAnalyzer': 'module_analyzer',
+
+    'PatternType': 'patterns',
+    'PatternCache': 'patterns',
+    'PatternMatcher': 'patterns',
+
+    'comprehensive_repr': 'repr'
+}
+
+if TYPE_CHECKING:
+    from .module_analyzer import (
+        ImportInfo,
+        FunctionInfo,
+        ClassInfo,
+        ModuleInfo,
+        ModuleAnalyzer
+    )
+
+    from .patterns import (
+        PatternType,
+        PatternCache,
+        PatternMatcher
+    )
+
+    from .repr import (
+        comprehensive_repr
+    )
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List module attributes including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
 __all__ = [
     'ImportInfo',
@@ -19,9 +19,14 @@ performance through careful caching and incremental analysis.
 Path: pyweaver/utils/module_analyzer.py
 """
 import ast
+import hashlib
 import logging
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, Optional, List, Any, NamedTuple
+from typing import Dict, FrozenSet, Iterable, Iterator, Set, Optional, List, Any, NamedTuple
 from dataclasses import dataclass, field
 
 from .repr import comprehensive_repr
@@ -31,6 +36,9 @@ from ..common.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Below this many uncached files, process pool startup outweighs the gain
+_PARALLEL_THRESHOLD = 4
+
 class ImportInfo(NamedTuple):
     """Information about a module import.
 
@@ -45,12 +53,12 @@ class ImportInfo(NamedTuple):
         alias: Optional alias for the import
     """
     module_path: str
-    names: Set[str]
+    names: FrozenSet[str]
     is_relative: bool
     level: int = 0
     alias: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function definition.
 
@@ -78,7 +86,7 @@ class FunctionInfo:
     is_classmethod: bool = False
     is_staticmethod: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class definition.
 
@@ -106,7 +114,7 @@ class ClassInfo:
     is_dataclass: bool = False
     nested_classes: Dict[str, 'ClassInfo'] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """Information extracted from a Python module.
 
@@ -118,9 +126,9 @@ class ModuleInfo:
         docstring: Module's docstring
         classes: Dictionary of class information
         functions: Dictionary of function information
-        imports: Set of import statements
-        exports: Set of explicitly exported names
-        dependencies: Set of module dependencies
+        imports: Frozen set of import statements
+        exports: Frozen set of explicitly exported names
+        dependencies: Frozen set of module dependencies
         variables: Dictionary of module-level variables
         all_declarations: Set of all declared names
         errors: List of any errors encountered
@@ -129,9 +137,9 @@ class ModuleInfo:
     docstring: str = ""
     classes: Dict[str, ClassInfo] = field(default_factory=dict)
     functions: Dict[str, FunctionInfo] = field(default_factory=dict)
-    imports: Set[ImportInfo] = field(default_factory=set)
-    exports: Set[str] = field(default_factory=set)
-    dependencies: Set[str] = field(default_factory=set)
+    imports: FrozenSet[ImportInfo] = frozenset()
+    exports: FrozenSet[str] = frozenset()
+    dependencies: FrozenSet[str] = frozenset()
     variables: Dict[str, Any] = field(default_factory=dict)
     all_declarations: Set[str] = field(default_factory=set)
     errors: List[str] = field(default_factory=list)
@@ -141,6 +149,39 @@ class ModuleInfo:
         self.errors.append(error)
         logger.error("Module %s: %s", self.path, error)
 
+# Statements whose bodies open a new scope rather than adding module names
+_SCOPE_NODES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Statement types _analyze_node extracts information from
+_ANALYZED_TYPES = frozenset({
+    ast.ClassDef, ast.FunctionDef, ast.Import, ast.ImportFrom, ast.Assign
+})
+
+def _iter_module_statements(node: ast.AST) -> Iterator[ast.AST]:
+    """Yield the module-level statements of a node in source order.
+
+    Compound statements such as if, try and with blocks are descended
+    into, since names bound there still belong to the module. Class and
+    function bodies are not.
+
+    Args:
+        node: Module node to iterate
+
+    Yields:
+        Module-level statement nodes
+    """
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current is not node:
+            yield current
+            if isinstance(current, _SCOPE_NODES):
+                continue
+        stack.extend(reversed([
+            child for child in ast.iter_child_nodes(current)
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))
+        ]))
+
 class ModuleAnalyzer:
     """Analyzes Python modules to extract structural information.
 
@@ -177,14 +218,18 @@ class ModuleAnalyzer:
         ```
     """
 
-    def __init__(self, cache_size: int = 100):
+    def __init__(self, cache_size: int = 100, cache_dir: Optional[Path] = None):
         """Initialize analyzer with optional cache size.
 
         Args:
             cache_size: Maximum number of modules to cache
+            cache_dir: Optional directory for a persistent analysis cache.
+                Results are stored per file contents stamp, so unchanged
+                files skip parsing on later runs.
         """
         self._file_cache: Dict[Path, ModuleInfo] = {}
         self._cache_size = cache_size
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
         self._cache_hits = 0
         self._cache_misses = 0
 
@@ -219,6 +264,11 @@ class ModuleAnalyzer:
             if info := self._check_cache(file_path):
                 return info
 
+            disk_path = self._disk_cache_path(file_path, package_name)
+            if disk_path is not None and (info := self._load_disk_cache(disk_path)):
+                self._update_cache(file_path, info)
+                return info
+
             # Read and parse file
             content = self._read_file(file_path)
             tree = self._parse_content(content, file_path)
@@ -234,6 +284,8 @@ class ModuleAnalyzer:
 
             # Update cache
             self._update_cache(file_path, info)
+            if disk_path is not None:
+                self._store_disk_cache(disk_path, info)
 
             return info
 
@@ -250,6 +302,98 @@ class ModuleAnalyzer:
                 original_error=e
             ) from e
 
+    def analyze_files(
+        self,
+        file_paths: Iterable[Path],
+        package_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        skip_errors: bool = False
+    ) -> Dict[Path, ModuleInfo]:
+        """Analyze several Python files, parsing them in worker processes.
+
+        Parsing and walking each file is CPU-bound and independent of the
+        others, so uncached files are spread across one process pool for
+        the whole batch. Callers should pass everything they need at once;
+        small batches, or a single available worker, are analyzed serially
+        to avoid the pool startup cost. If the pool cannot be started or
+        breaks, the remaining files are analyzed serially.
+
+        Args:
+            file_paths: Paths to Python files
+            package_name: Optional package name for dependency tracking
+            max_workers: Maximum worker processes (defaults to CPU count)
+            skip_errors: Leave files that fail analysis out of the result
+                instead of raising
+
+        Returns:
+            Dictionary mapping each file path to its ModuleInfo, in input order
+
+        Raises:
+            ProcessingError: If file analysis fails and skip_errors is False
+            FileError: If a file cannot be read and skip_errors is False
+        """
+        paths = list(file_paths)
+        pending = [path for path in paths if path not in self._file_cache]
+        parsed: Dict[Path, ModuleInfo] = {}
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        if len(pending) >= _PARALLEL_THRESHOLD and workers > 1:
+            parsed = self._analyze_in_pool(pending, package_name, workers)
+
+        results = {}
+        for path in paths:
+            try:
+                info = parsed.get(path) or self.analyze_file(path, package_name)
+            except (ProcessingError, FileError) as e:
+                if not skip_errors:
+                    raise
+                logger.warning("Skipping %s: %s", path, e)
+                continue
+            if info:
+                results[path] = info
+        return results
+
+    def _analyze_in_pool(
+        self,
+        paths: List[Path],
+        package_name: Optional[str],
+        workers: int
+    ) -> Dict[Path, ModuleInfo]:
+        """Analyze files across a process pool, caching the results.
+
+        Files that fail in a worker are left out, so the caller can analyze
+        them in-process and raise the real error.
+
+        Args:
+            paths: Uncached paths to analyze
+            package_name: Optional package name for dependency tracking
+            workers: Number of worker processes
+
+        Returns:
+            Dictionary of the files analyzed successfully
+        """
+        parsed: Dict[Path, ModuleInfo] = {}
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                analyzed = executor.map(
+                    _analyze_in_worker,
+                    paths,
+                    [package_name] * len(paths),
+                    [self._cache_dir] * len(paths),
+                    chunksize=max(1, len(paths) // workers)
+                )
+                for path, info in zip(paths, analyzed):
+                    if info is not None:
+                        self._cache_misses += 1
+                        self._update_cache(path, info)
+                        parsed[path] = info
+        # Any pool failure falls back to serial analysis: BrokenProcessPool,
+        # spawn bootstrap errors or an AssertionError when started from a
+        # daemonic process
+        except Exception as e:
+            logger.warning("Process pool failed, analyzing serially: %s", e)
+        return parsed
+
     def _check_cache(self, file_path: Path) -> Optional[ModuleInfo]:
         """Check if a module's analysis is cached.
 
@@ -283,6 +427,78 @@ class ModuleAnalyzer:
         self._file_cache[file_path] = info
         logger.debug("Cached analysis for %s", file_path)
 
+    def _disk_cache_path(
+        self,
+        file_path: Path,
+        package_name: Optional[str]
+    ) -> Optional[Path]:
+        """Get the persistent cache entry for a file's current contents.
+
+        The key covers the resolved path, modification time, size, package
+        name and Python version, so any change to the file or interpreter
+        selects a fresh entry.
+
+        Args:
+            file_path: Path to Python file
+            package_name: Package name the analysis is made for
+
+        Returns:
+            Cache entry path, or None if persistent caching is disabled or
+            the file cannot be stat'ed
+        """
+        if self._cache_dir is None:
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        stamp = (
+            f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:"
+            f"{package_name}:{sys.version_info[:2]}"
+        )
+        key = hashlib.blake2b(stamp.encode('utf-8'), digest_size=8).hexdigest()
+        return self._cache_dir / f"{key}.pkl"
+
+    def _load_disk_cache(self, cache_path: Path) -> Optional[ModuleInfo]:
+        """Load a persisted analysis result.
+
+        Args:
+            cache_path: Cache entry path
+
+        Returns:
+            Cached ModuleInfo, or None if missing or unreadable
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                info = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", cache_path, e)
+            return None
+
+        if not isinstance(info, ModuleInfo):
+            return None
+        logger.debug("Loaded cached analysis from %s", cache_path)
+        return info
+
+    def _store_disk_cache(self, cache_path: Path, info: ModuleInfo) -> None:
+        """Persist an analysis result, ignoring write failures.
+
+        Args:
+            cache_path: Cache entry path
+            info: Analysis results to store
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug("Could not write cache entry %s: %s", cache_path, e)
+
     def _read_file(self, path: Path) -> str:
         """Read a Python source file.
 
@@ -296,7 +512,21 @@ class ModuleAnalyzer:
             FileError: If file cannot be read
         """
         try:
-            return path.read_text(encoding='utf-8')
+            # Whole-file read straight from the descriptor, skipping the
+            # buffered text wrapper and its extra seek/isatty calls
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, 1 << 16))
+            finally:
+                os.close(fd)
+
+            content = b''.join(chunks).decode('utf-8')
+            if '\r' in content:
+                # Match the universal newline handling of read_text
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
 
         except Exception as e:
             context = ErrorContext(
@@ -363,59 +593,70 @@ class ModuleAnalyzer:
     ) -> None:
         """Analyze an AST node and update module information.
 
-        This method recursively analyzes AST nodes, extracting relevant
-        information and updating the ModuleInfo object.
+        This method analyzes the module-level statements of a node,
+        extracting relevant information and updating the ModuleInfo object.
+        Class and function bodies are left to _analyze_class, so methods
+        and nested definitions are not reported as module exports.
 
         Args:
             node: AST node to analyze
             info: ModuleInfo to update
             package_name: Optional package name for dependency tracking
         """
-        for child in ast.walk(node):
+        # Collected into plain sets, then frozen onto info once complete
+        exports: Set[str] = set()
+        imports: Set[ImportInfo] = set()
+        dependencies: Set[str] = set()
+
+        # Identifiers are never empty, so privacy checks read the first
+        # character instead of calling startswith for every definition
+        for child in _iter_module_statements(node):
+            # Skip statements that bind nothing we track with one set probe
+            if type(child) not in _ANALYZED_TYPES:
+                continue
+
             # Handle classes
             if isinstance(child, ast.ClassDef):
                 class_info = self._analyze_class(child)
-                if not child.name.startswith('_'):
+                if child.name[0] != '_':
                     info.classes[child.name] = class_info
-                    info.exports.add(child.name)
+                    exports.add(child.name)
                 info.all_declarations.add(child.name)
 
             # Handle functions
             elif isinstance(child, ast.FunctionDef):
-                if not hasattr(child, '_processed'):
-                    func_info = self._analyze_function(child)
-                    if not child.name.startswith('_'):
-                        info.functions[child.name] = func_info
-                        info.exports.add(child.name)
-                    info.all_declarations.add(child.name)
-                    child._processed = True
+                func_info = self._analyze_function(child)
+                if child.name[0] != '_':
+                    info.functions[child.name] = func_info
+                    exports.add(child.name)
+                info.all_declarations.add(child.name)
 
             # Handle imports
             elif isinstance(child, ast.Import):
                 for name in child.names:
                     import_info = ImportInfo(
                         module_path=name.name,
-                        names={name.asname or name.name},
+                        names=frozenset((name.asname or name.name,)),
                         is_relative=False,
                         alias=name.asname
                     )
-                    info.imports.add(import_info)
+                    imports.add(import_info)
                     if package_name and name.name.startswith(package_name):
-                        info.dependencies.add(name.name)
+                        dependencies.add(name.name)
 
             # Handle from imports
             elif isinstance(child, ast.ImportFrom):
                 if child.module:
-                    names = {n.name for n in child.names}
+                    names = frozenset(n.name for n in child.names)
                     import_info = ImportInfo(
                         module_path=child.module,
                         names=names,
                         is_relative=child.level > 0,
                         level=child.level
                     )
-                    info.imports.add(import_info)
+                    imports.add(import_info)
                     if package_name and child.module.startswith(package_name):
-                        info.dependencies.add(child.module)
+                        dependencies.add(child.module)
 
             # Handle __all__ assignments
             elif (isinstance(child, ast.Assign) and
@@ -424,16 +665,20 @@ class ModuleAnalyzer:
                 if isinstance(child.value, ast.List):
                     for elt in child.value.elts:
                         if isinstance(elt, ast.Constant):
-                            info.exports.add(elt.s)
+                            exports.add(elt.s)
 
             # Handle variable assignments
             elif isinstance(child, ast.Assign):
                 for target in child.targets:
                     if isinstance(target, ast.Name):
-                        if not target.id.startswith('_'):
+                        if target.id[0] != '_':
                             info.variables[target.id] = self._get_value(child.value)
                         info.all_declarations.add(target.id)
 
+        info.exports |= exports
+        info.imports |= imports
+        info.dependencies |= dependencies
+
     def _analyze_class(self, node: ast.ClassDef) -> ClassInfo:
         """Analyze a class definition node.
 
@@ -662,4 +907,26 @@ class ModuleAnalyzer:
             exclude=['_file_cache'],
             prioritize=['_cache_size', '_cache_hits', '_cache_misses'],
             one_per_line=True
-        )
\ No newline at end of file
+        )
+
+def _analyze_in_worker(
+    file_path: Path,
+    package_name: Optional[str],
+    cache_dir: Optional[Path] = None
+) -> Optional[ModuleInfo]:
+    """Analyze one file in a worker process for ModuleAnalyzer.analyze_files.
+
+    Args:
+        file_path: Path to Python file
+        package_name: Optional package name for dependency tracking
+        cache_dir: Optional persistent cache directory
+
+    Returns:
+        ModuleInfo if successful, None on error
+    """
+    try:
+        analyzer = ModuleAnalyzer(cache_size=1, cache_dir=cache_dir)
+        return analyzer.analyze_file(file_path, package_name)
+    except Exception as e:
+        logger.debug("Worker failed to analyze %s: %s", file_path, e)
+        return None
\ No newline at end of file
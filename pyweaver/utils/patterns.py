@@ -17,8 +17,9 @@ Path: pyweaver/utils/patterns.py
 """
 import re
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Set, Dict, Pattern, NamedTuple
+from typing import FrozenSet, Iterable, Optional, Set, Dict, Pattern, NamedTuple, Tuple
 
 from pyweaver.utils.repr import comprehensive_repr
 from pyweaver.common.errors import (ErrorContext, ErrorCode, ValidationError)
@@ -52,6 +53,8 @@ class PatternCache:
         match_results: Cache of path match results
         max_size: Maximum number of cached results
     """
+    __slots__ = ('regex_patterns', 'match_results', 'max_size')
+
     def __init__(self, max_size: int = 1000):
         """Initialize pattern cache.
 
@@ -59,7 +62,7 @@ class PatternCache:
             max_size: Maximum number of cached results
         """
         self.regex_patterns: Dict[str, Pattern] = {}
-        self.match_results: Dict[str, bool] = {}
+        self.match_results: Dict[Tuple[str, str], bool] = {}
         self.max_size = max_size
 
     def get_pattern(self, pattern: str) -> Optional[Pattern]:
@@ -74,11 +77,11 @@ class PatternCache:
         if len(self.regex_patterns) > self.max_size:
             self.regex_patterns.pop(next(iter(self.regex_patterns)))
 
-    def get_result(self, key: str) -> Optional[bool]:
+    def get_result(self, key: Tuple[str, str]) -> Optional[bool]:
         """Get cached match result."""
         return self.match_results.get(key)
 
-    def set_result(self, key: str, result: bool) -> None:
+    def set_result(self, key: Tuple[str, str], result: bool) -> None:
         """Cache match result."""
         self.match_results[key] = result
 
@@ -91,6 +94,111 @@ class PatternCache:
         self.regex_patterns.clear()
         self.match_results.clear()
 
+@lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> Optional[Pattern]:
+    """Compile a glob pattern to a regex shared by all matchers.
+
+    Compiled patterns are immutable, so one instance per pattern string is
+    reused across every PatternMatcher in the process.
+
+    Args:
+        pattern: Normalized glob pattern to compile
+
+    Returns:
+        Compiled regex pattern or None if compilation fails
+    """
+    try:
+        return re.compile(PatternMatcher._convert_glob_to_regex(pattern))
+    except re.error as e:
+        logger.warning("Invalid pattern '%s': %s", pattern, e)
+        return None
+
+@lru_cache(maxsize=256)
+def _compile_path_patterns(patterns: FrozenSet[str]) -> Optional[Pattern]:
+    """Compile a set of path glob patterns into one alternation regex.
+
+    Args:
+        patterns: Normalized path glob patterns to combine
+
+    Returns:
+        Compiled regex matching any of the patterns, or None if empty
+
+    Raises:
+        re.error: If a pattern does not produce a valid regex
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?:{PatternMatcher._convert_glob_to_regex(pattern)})"
+        for pattern in sorted(patterns)
+    ))
+
+@lru_cache(maxsize=4096)
+def _compile_name_pattern(pattern: str) -> Pattern:
+    """Compile a single name pattern, shared by all matchers.
+
+    Args:
+        pattern: Name glob pattern to compile
+
+    Returns:
+        Compiled regex for the pattern
+
+    Raises:
+        re.error: If the pattern does not produce a valid regex
+    """
+    return re.compile(PatternMatcher._convert_name_pattern_to_regex(pattern))
+
+@lru_cache(maxsize=4096)
+def _compile_name_patterns(patterns: FrozenSet[str]) -> Optional[Pattern]:
+    """Compile a set of name patterns into one alternation regex.
+
+    Args:
+        patterns: Name glob patterns to combine
+
+    Returns:
+        Compiled regex matching any of the patterns, or None if empty
+
+    Raises:
+        re.error: If a pattern does not produce a valid regex
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?:{PatternMatcher._convert_name_pattern_to_regex(pattern)})"
+        for pattern in sorted(patterns)
+    ))
+
+@lru_cache(maxsize=1024)
+def _compile_name_predicate(
+    include: FrozenSet[str],
+    exclude: FrozenSet[str]
+) -> Pattern:
+    """Compile include and exclude name patterns into one predicate regex.
+
+    Exclusions become a negative lookahead in front of the include
+    alternation, so a single match decides both.
+
+    Args:
+        include: Name patterns a name must match (any name if empty)
+        exclude: Name patterns a name must not match
+
+    Returns:
+        Compiled regex that matches exactly the accepted names
+
+    Raises:
+        re.error: If a pattern does not produce a valid regex
+    """
+    def alternation(patterns: FrozenSet[str]) -> str:
+        return "|".join(
+            f"(?:{PatternMatcher._convert_name_pattern_to_regex(pattern)})"
+            for pattern in sorted(patterns)
+        )
+
+    regex = f"(?!{alternation(exclude)})" if exclude else ""
+    if include:
+        regex += f"(?:{alternation(include)})"
+    return re.compile(regex)
+
 class PatternMatcher:
     """Utility for matching various types of patterns.
 
@@ -178,8 +286,9 @@ class PatternMatcher:
             pattern = pattern.replace('\\', '/')
 
             # Check cache first
-            cache_key = f"{path_str}:{pattern}"
-            if cached := self._path_cache.get_result(cache_key):
+            cache_key = (path_str, pattern)
+            cached = self._path_cache.get_result(cache_key)
+            if cached is not None:
                 return cached
 
             # Get or create regex pattern
@@ -233,15 +342,13 @@ class PatternMatcher:
         """
         try:
             # Check cache first
-            cache_key = f"{name}:{pattern}"
-            if cached := self._name_cache.get_result(cache_key):
+            cache_key = (name, pattern)
+            cached = self._name_cache.get_result(cache_key)
+            if cached is not None:
                 return cached
 
-            # Convert to regex pattern
-            regex_pattern = self._convert_name_pattern_to_regex(pattern)
-
-            # Perform match
-            matches = bool(re.match(regex_pattern, name))
+            # Match with the shared compiled pattern
+            matches = _compile_name_pattern(pattern).match(name) is not None
 
             # Cache result
             self._name_cache.set_result(cache_key, matches)
@@ -260,6 +367,110 @@ class PatternMatcher:
                 original_error=e
             ) from e
 
+    @staticmethod
+    def compile_path_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+        """Compile path glob patterns into a single reusable regex.
+
+        Searching a normalized path with the result is equivalent to calling
+        matches_path_pattern for each pattern, but costs a single regex
+        search. Compiled regexes are shared across matchers.
+
+        Args:
+            patterns: Path glob patterns to combine
+
+        Returns:
+            Compiled regex matching any of the patterns, or None if empty
+
+        Raises:
+            ValidationError: If a pattern is invalid
+        """
+        patterns = frozenset(pattern.replace('\\', '/') for pattern in patterns)
+        try:
+            return _compile_path_patterns(patterns)
+        except re.error as e:
+            context = ErrorContext(
+                operation="compile_path_patterns",
+                error_code=ErrorCode.VALIDATION_FORMAT,
+                details={"patterns": sorted(patterns)}
+            )
+            raise ValidationError(
+                f"Invalid path pattern: {e}",
+                context=context,
+                original_error=e
+            ) from e
+
+    @staticmethod
+    def compile_name_patterns(patterns: Iterable[str]) -> Optional[Pattern]:
+        """Compile name patterns into a single reusable regex.
+
+        Matching a name against the result is equivalent to calling
+        matches_name_pattern for each pattern, but costs a single regex
+        match. Compiled regexes are shared across matchers.
+
+        Args:
+            patterns: Name glob patterns to combine
+
+        Returns:
+            Compiled regex matching any of the patterns, or None if empty
+
+        Raises:
+            ValidationError: If a pattern is invalid
+        """
+        patterns = frozenset(patterns)
+        try:
+            return _compile_name_patterns(patterns)
+        except re.error as e:
+            context = ErrorContext(
+                operation="compile_name_patterns",
+                error_code=ErrorCode.VALIDATION_FORMAT,
+                details={"patterns": sorted(patterns)}
+            )
+            raise ValidationError(
+                f"Invalid name pattern: {e}",
+                context=context,
+                original_error=e
+            ) from e
+
+    @staticmethod
+    def compile_name_predicate(
+        include: Iterable[str],
+        exclude: Iterable[str]
+    ) -> Pattern:
+        """Compile include and exclude name patterns into a single regex.
+
+        A name matches the result when it matches none of the exclude
+        patterns and, if any include patterns are given, at least one of
+        them. Compiled regexes are shared across matchers.
+
+        Args:
+            include: Name glob patterns to accept (all names if empty)
+            exclude: Name glob patterns to reject
+
+        Returns:
+            Compiled predicate regex
+
+        Raises:
+            ValidationError: If a pattern is invalid
+        """
+        include = frozenset(include)
+        exclude = frozenset(exclude)
+        try:
+            return _compile_name_predicate(include, exclude)
+        except re.error as e:
+            context = ErrorContext(
+                operation="compile_name_predicate",
+                error_code=ErrorCode.VALIDATION_FORMAT,
+                details={
+                    "include": sorted(include),
+                    "exclude": sorted(exclude)
+                }
+            )
+            raise ValidationError(
+                f"Invalid name pattern: {e}",
+                context=context,
+                original_error=e
+            ) from e
+
     def is_excluded_path(self, path: Path | str) -> bool:
         """Check if a path should be excluded.
 
@@ -272,10 +483,22 @@ class PatternMatcher:
         Returns:
             True if path matches any exclusion pattern
         """
+        if not self.excluded_paths:
+            return False
+
         try:
             path_str = self._normalize_path(path)
             logger.debug("Checking exclusion patterns for path: %s", path_str)
 
+            # One search of the combined regex decides the common case
+            try:
+                regex = self.compile_path_patterns(self.excluded_paths)
+            except ValidationError:
+                regex = None
+            if regex is not None and not regex.search(path_str):
+                return False
+
+            # Matched (or a pattern is invalid): find the pattern responsible
             for pattern in self.excluded_paths:
                 try:
                     if self.matches_path_pattern(path_str, pattern):
@@ -341,8 +564,8 @@ class PatternMatcher:
     def _get_or_create_pattern(self, pattern: str) -> Optional[Pattern]:
         """Get or create a compiled regex pattern.
 
-        This method handles pattern compilation and caching for
-        efficient matching.
+        Compilation is cached at module level, so matchers share compiled
+        patterns instead of each compiling their own copy.
 
         Args:
             pattern: Glob pattern to compile
@@ -350,29 +573,19 @@ class PatternMatcher:
         Returns:
             Compiled regex pattern or None if compilation fails
         """
-        try:
-            # Check cache first
-            if cached := self._path_cache.get_pattern(pattern):
-                return cached
-
-            # Convert glob to regex and compile
-            regex_pattern = self._convert_glob_to_regex(pattern)
-            compiled = re.compile(regex_pattern)
-
-            # Cache pattern
-            self._path_cache.set_pattern(pattern, compiled)
-
-            return compiled
-
-        except re.error as e:
-            logger.warning("Invalid pattern '%s': %s", pattern, e)
-            return None
+        return _compile_glob(pattern)
 
-    def _convert_glob_to_regex(self, pattern: str) -> str:
+    @staticmethod
+    def _convert_glob_to_regex(pattern: str) -> str:
         """Convert glob pattern to regex pattern.
 
-        This method handles the conversion of glob-style patterns to
-        proper regex patterns that handle all our matching needs.
+        The pattern is translated in a single left-to-right scan. Literal
+        characters are escaped, '*' and '?' never cross a '/', and '**'
+        segments match any number of directories. The result matches whole
+        path segments, so "*.py" matches "src/a.py" but not "src/a.pyc".
+        Non-absolute patterns may match at any directory level. The regex
+        has no nested ambiguous quantifiers, so matching cannot backtrack
+        catastrophically.
 
         Args:
             pattern: Glob pattern to convert
@@ -380,29 +593,64 @@ class PatternMatcher:
         Returns:
             Regex pattern string
         """
-        pattern_info = self._analyze_pattern(pattern)
+        pattern_info = PatternMatcher._analyze_pattern(pattern)
 
         # Handle negation
         if pattern_info.is_negated:
             pattern = pattern[1:]
 
-        # Handle leading dot
-        if pattern.startswith('.'):
-            pattern = pattern[1:]
-
-        # Convert glob syntax to regex
-        pattern = pattern.replace('**/', '.*?/')
-        pattern = pattern.replace('/**', '/.*?')
-        pattern = pattern.replace('*', '[^/]*')
-        pattern = pattern.replace('?', '[^/]')
+        parts = []
+        i, n = 0, len(pattern)
+        while i < n:
+            char = pattern[i]
+            if char == '*':
+                if pattern.startswith('**/', i):
+                    parts.append('(?:[^/]*/)*')
+                    i += 3
+                elif pattern.startswith('**', i):
+                    parts.append('.*')
+                    i += 2
+                else:
+                    parts.append('[^/]*')
+                    i += 1
+                continue
+
+            if char == '?':
+                parts.append('[^/]')
+            elif char == '[' and (end := PatternMatcher._find_class_end(pattern, i)) != -1:
+                # As in fnmatch, only '!' negates; a leading ']' is a member
+                # and a leading '^' is literal
+                negated = pattern.startswith('!', i + 1)
+                members = pattern[i + 2 if negated else i + 1:end].replace('\\', '\\\\')
+                if negated:
+                    members = '^' + members
+                elif members[0] == '^':
+                    members = '\\' + members
+                parts.append('[' + members + ']')
+                i = end
+            else:
+                parts.append(re.escape(char))
+            i += 1
+
+        prefix = '^' if pattern_info.is_absolute else '(?:^|/)'
+        return f"{prefix}{''.join(parts)}(?:/|$)"
+
+    @staticmethod
+    def _find_class_end(pattern: str, start: int) -> int:
+        """Find the ']' closing a glob character class.
 
-        # Add anchors if absolute
-        if pattern_info.is_absolute:
-            pattern = '^' + pattern
+        Args:
+            pattern: Glob pattern
+            start: Index of the opening '['
 
-        return pattern
+        Returns:
+            Index of the closing ']', or -1 if the class is not closed
+        """
+        first = start + 2 if pattern.startswith('!', start + 1) else start + 1
+        return pattern.find(']', first + 1)
 
-    def _convert_name_pattern_to_regex(self, pattern: str) -> str:
+    @staticmethod
+    def _convert_name_pattern_to_regex(pattern: str) -> str:
         """Convert name glob pattern to regex pattern.
 
         This method handles the conversion of simple name-matching
@@ -417,7 +665,8 @@ class PatternMatcher:
         regex_pattern = pattern.replace('*', '[^/]*')
         return f"^{regex_pattern}$"
 
-    def _analyze_pattern(self, pattern: str) -> PatternType:
+    @staticmethod
+    def _analyze_pattern(pattern: str) -> PatternType:
         """Analyze pattern to determine its characteristics.
 
         This method examines a pattern to understand its type and
@@ -176,8 +176,11 @@ def comprehensive_repr(
         joiner = f"\n{indent}" if one_per_line else ", "
         starter = f"\n{indent}" if one_per_line else ""
 
-        # Handle different types of objects
-        if isinstance(obj, (str, int, float, bool, type(None))):
+        # Handle different types of objects (enums first, as they may mix in str/int)
+        if isinstance(obj, Enum):
+            return f"{obj.__class__.__name__}.{obj.name}"
+
+        elif isinstance(obj, (str, int, float, bool, type(None))):
             return repr(obj)
 
         elif isinstance(obj, (datetime, date)):
@@ -186,9 +189,6 @@ def comprehensive_repr(
         elif isinstance(obj, Path):
             return f"Path('{obj}')"
 
-        elif isinstance(obj, Enum):
-            return f"{obj.__class__.__name__}.{obj.name}"
-
         elif isinstance(obj, (list, tuple, set)):
             return _format_sequence(obj, config, _depth, _visited)
 
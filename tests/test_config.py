@@ -0,0 +1,143 @@
+"""Test suite for configuration handling.
+
+This module tests effective settings resolution for path and init
+configurations, including isolation of the settings handed to callers.
+
+Path: tests/test_config.py
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pyweaver.common.errors import ConfigError
+from pyweaver.config.base import _SETTINGS_CACHE_SIZE
+from pyweaver.config.init import InitConfig, InitSettings
+from pyweaver.config.path import PathConfig
+
+def test_path_settings_merge_builds_new_containers():
+    """Test that merged path settings do not share containers with the config."""
+    config = PathConfig(
+        global_settings={"ignore_patterns": {"*.pyc"}},
+        path_specific={
+            "src/a": {"ignore_patterns": {"*.tmp"}},
+            "src/b": {"ignore_patterns": {"*.tmp"}}
+        }
+    )
+
+    assert config.get_settings_for_path("docs") is not config.global_settings
+
+    first = config.get_settings_for_path(Path("src/a/x.py"))
+    second = config.get_settings_for_path(Path("src/b/x.py"))
+    assert first == second
+    assert first is not second
+
+    first.ignore_patterns.add("*.bak")
+    first.additional_options["mode"] = "strict"
+    assert second.ignore_patterns == {"*.pyc", "*.tmp"}
+    assert second.additional_options == {}
+    assert config.global_settings.ignore_patterns == {"*.pyc"}
+    assert config.path_specific[Path("src/a")].ignore_patterns == {"*.tmp"}
+
+def test_init_settings_merge_leaves_inputs_intact():
+    """Test that merging shares unchanged settings without mutating inputs."""
+    config = InitConfig(
+        global_settings={
+            "excluded_paths": ["*.pyc"],
+            "sections": {"classes": {"include_patterns": ["*"]}}
+        },
+        path_specific={"src/a": {"excluded_paths": ["build"]}}
+    )
+
+    assert config.get_settings_for_path("docs") is config.global_settings
+
+    merged = config.get_settings_for_path("src/a/module")
+    assert merged.excluded_paths == {"*.pyc", "build"}
+    assert config.path_specific[Path("src/a")].excluded_paths == {"build"}
+    assert config.global_settings.excluded_paths == {"*.pyc"}
+
+def test_lazy_init_config_validates_on_lookup(tmp_path: Path):
+    """Test that lazily loaded path entries are validated when matched."""
+    config_path = tmp_path / "init_config.json"
+    config_path.write_text(json.dumps({
+        "global_settings": {"excluded_paths": ["*.pyc"]},
+        "path_specific": {
+            "src/a": {"excluded_paths": ["build"]},
+            "src/bad": {"export_mode": "unknown"}
+        }
+    }))
+
+    config = InitConfig.from_file_lazy(config_path)
+    assert config.path_specific == {}
+
+    settings = config.get_settings_for_path(Path("src/a/module.py"))
+    assert settings.excluded_paths == {"*.pyc", "build"}
+    assert isinstance(config.path_specific[Path("src/a")], InitSettings)
+    assert all(
+        isinstance(value, InitSettings)
+        for value in config.path_specific.values()
+    )
+
+    with pytest.raises(ConfigError):
+        config.get_settings_for_path("src/bad/module.py")
+    assert Path("src/bad") not in config.path_specific
+
+    config.path_specific = {}
+    assert config.get_settings_for_path("src/a/module.py").excluded_paths == {"*.pyc"}
+
+def test_lazy_init_config_creates_default(tmp_path: Path):
+    """Test that a missing file is created with the default configuration."""
+    config_path = tmp_path / "config" / "init_config.json"
+
+    config = InitConfig.from_file_lazy(config_path)
+
+    assert config_path.exists()
+    assert config.global_settings == InitConfig.from_file(config_path).global_settings
+
+def test_init_config_reload_reads_current_file(tmp_path: Path):
+    """Test that reloading sees edits even when mtime and size are unchanged."""
+    config_path = tmp_path / "init_config.json"
+    config_path.write_text(json.dumps({"global_settings": {"docstring": "aaaa"}}))
+    stat = config_path.stat()
+
+    assert InitConfig.from_file(config_path).global_settings.docstring == "aaaa"
+
+    config_path.write_text(json.dumps({"global_settings": {"docstring": "bbbb"}}))
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert InitConfig.from_file(config_path).global_settings.docstring == "bbbb"
+    assert InitConfig.from_file_lazy(config_path).global_settings.docstring == "bbbb"
+
+@pytest.mark.parametrize("path", [
+    "src/a/x.py",
+    "./src/a/x.py",
+    "src/a/x.py/",
+    Path("src/a/x.py")
+])
+def test_settings_lookup_normalizes_paths(path):
+    """Test that equivalent path spellings share prefix matches and cache entries."""
+    config = PathConfig(
+        global_settings={"ignore_patterns": {"*.pyc"}},
+        path_specific={"src/a": {"ignore_patterns": {"*.tmp"}}}
+    )
+
+    settings = config.get_settings_for_path(path)
+
+    assert settings.ignore_patterns == {"*.pyc", "*.tmp"}
+    assert settings is config.get_settings_for_path(Path("src/a/x.py"))
+
+def test_settings_view_cache_is_bounded():
+    """Test that settings views are evicted least recently used first."""
+    config = InitConfig(global_settings={"docstring": "Package."})
+    first = config.get_settings_view("pkg_0")
+
+    for index in range(1, _SETTINGS_CACHE_SIZE):
+        config.get_settings_view(f"pkg_{index}")
+    assert config.get_settings_view("pkg_0") is first
+
+    config.get_settings_view("pkg_overflow")
+    assert len(config._view_cache) == _SETTINGS_CACHE_SIZE
+    assert "pkg_1" not in config._view_cache
+    assert config.get_settings_view("pkg_0") is first
@@ -13,6 +13,7 @@ from typing import Generator, Any
 import pytest
 
 from pyweaver.config.combiner import ContentMode, FileSectionConfig
+from pyweaver.processors._impl._file_combiner import PythonProcessor
 from pyweaver.processors import (
     FileCombinerProcessor,
     combine_files
@@ -488,5 +489,63 @@ def test_convenience_function(mixed_source_files: Path):
     assert "UserList" in content
     assert "UserDetail" in content
 
+def test_python_docstring_stripping():
+    """Test that Python docstrings are removed without touching code."""
+    source = textwrap.dedent('''
+        """Module docstring."""
+        import os
+
+        class Widget:
+            """Class docstring
+            spanning lines.
+            """
+
+        def helper():
+            """Helper docstring."""
+            text = """not a docstring"""
+            return text
+    ''').lstrip()
+
+    result = PythonProcessor().process(source, ContentMode.NO_DOCSTRINGS)
+
+    assert result == textwrap.dedent('''
+        import os
+
+        class Widget:
+            pass
+
+        def helper():
+            text = """not a docstring"""
+            return text
+    ''').strip()
+
+def test_python_comment_stripping():
+    """Test that comments are removed while strings keep their hashes."""
+    source = textwrap.dedent('''
+        # Leading comment
+        value = "# not a comment"  # trailing comment
+        other = 1
+    ''').lstrip()
+
+    result = PythonProcessor().process(source, ContentMode.NO_COMMENTS)
+
+    assert result == 'value = "# not a comment"\nother = 1'
+
+def test_python_stripping_with_form_feeds():
+    """Test that form feeds and lone carriage returns keep line numbering."""
+    source = (
+        "x = 1\x0c  # page break\n"
+        "def f():\n"
+        "    \"\"\"Doc.\"\"\"\n"
+        "    return 1  # result\n"
+        "y = 2\n"
+    )
+    result = PythonProcessor().process(source, ContentMode.MINIMAL)
+    assert result == "x = 1\ndef f():\n    return 1\ny = 2"
+
+    source = "def f():\r    \"\"\"Doc.\"\"\"\r    return 1  # result\ry = 2\r"
+    result = PythonProcessor().process(source, ContentMode.MINIMAL)
+    assert result == "def f():\n    return 1\ny = 2"
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""Test suite for the Python module analyzer.
+
+This module tests batch analysis of modules, including the process pool
+used for larger batches and its serial fallbacks, and the persistent
+analysis cache.
+
+Path: tests/test_module_analyzer.py
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+import os
+from pathlib import Path
+import pickle
+import textwrap
+from typing import List
+
+import pytest
+
+from pyweaver.common.errors import ProcessingError
+from pyweaver.utils import module_analyzer
+from pyweaver.utils.module_analyzer import ModuleAnalyzer
+
+@pytest.fixture
+def module_files(tmp_path: Path) -> List[Path]:
+    """Create a batch of small, independent modules."""
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(textwrap.dedent(f'''
+            """Module {index}."""
+            import os
+
+            class Widget{index}:
+                def method(self):
+                    pass
+
+            def helper_{index}():
+                pass
+
+            VALUE_{index} = {index}
+        '''))
+        paths.append(path)
+    return paths
+
+class RecordingExecutor:
+    """In-process stand-in for ProcessPoolExecutor that records map calls."""
+
+    instances: List["RecordingExecutor"] = []
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.chunksize = None
+        RecordingExecutor.instances.append(self)
+
+    def __enter__(self) -> "RecordingExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def map(self, func, *iterables, chunksize: int = 1):
+        self.chunksize = chunksize
+        return map(func, *iterables)
+
+class BrokenExecutor(RecordingExecutor):
+    """Executor whose workers die mid-batch."""
+
+    def map(self, func, *iterables, chunksize: int = 1):
+        raise BrokenProcessPool("worker terminated abruptly")
+
+class DaemonicExecutor(RecordingExecutor):
+    """Executor that fails like a pool started from a daemonic process."""
+
+    def __init__(self, max_workers: int):
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+@pytest.fixture
+def recording_executor(monkeypatch: pytest.MonkeyPatch):
+    """Replace the analyzer's process pool with RecordingExecutor."""
+    RecordingExecutor.instances = []
+    monkeypatch.setattr(module_analyzer, "ProcessPoolExecutor", RecordingExecutor)
+    return RecordingExecutor
+
+def test_analyze_files_matches_serial_analysis(module_files: List[Path]):
+    """Test that pooled analysis gives the same results as analyze_file."""
+    batch = ModuleAnalyzer().analyze_files(module_files, max_workers=2)
+
+    assert list(batch) == module_files
+    serial = ModuleAnalyzer()
+    for path in module_files:
+        expected = serial.analyze_file(path)
+        assert batch[path].exports == expected.exports
+        assert batch[path].imports == expected.imports
+        assert set(batch[path].classes) == set(expected.classes)
+
+def test_analyze_files_chunks_across_workers(
+    module_files: List[Path],
+    recording_executor
+):
+    """Test that one pool serves the batch with work split across workers."""
+    ModuleAnalyzer().analyze_files(module_files, max_workers=3)
+
+    assert len(recording_executor.instances) == 1
+    executor = recording_executor.instances[0]
+    assert executor.max_workers == 3
+    assert executor.chunksize == 4
+
+def test_analyze_files_serial_for_single_worker(
+    module_files: List[Path],
+    recording_executor,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that no pool is started when only one worker is available."""
+    monkeypatch.setattr(module_analyzer.os, "cpu_count", lambda: 1)
+    results = ModuleAnalyzer().analyze_files(module_files)
+
+    assert len(results) == len(module_files)
+    assert not recording_executor.instances
+
+def test_analyze_files_serial_for_small_batches(
+    module_files: List[Path],
+    recording_executor
+):
+    """Test that batches below the threshold skip the pool."""
+    results = ModuleAnalyzer().analyze_files(module_files[:3], max_workers=4)
+
+    assert len(results) == 3
+    assert not recording_executor.instances
+
+def test_analyze_files_falls_back_on_broken_pool(
+    module_files: List[Path],
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a broken pool falls back to serial analysis."""
+    monkeypatch.setattr(module_analyzer, "ProcessPoolExecutor", BrokenExecutor)
+    results = ModuleAnalyzer().analyze_files(module_files, max_workers=2)
+
+    assert list(results) == module_files
+    assert "Widget0" in results[module_files[0]].exports
+
+def test_analyze_files_falls_back_in_daemonic_process(
+    module_files: List[Path],
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a pool refused inside a daemonic process falls back to serial."""
+    monkeypatch.setattr(module_analyzer, "ProcessPoolExecutor", DaemonicExecutor)
+    results = ModuleAnalyzer().analyze_files(module_files, max_workers=2)
+
+    assert list(results) == module_files
+
+def test_worker_logs_failures(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    """Test that a worker records the failure it turns into None."""
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n")
+
+    with caplog.at_level("DEBUG", logger=module_analyzer.__name__):
+        assert module_analyzer._analyze_in_worker(broken, None) is None
+    assert "broken.py" in caplog.text
+
+def test_analyze_files_error_handling(
+    module_files: List[Path],
+    tmp_path: Path,
+    recording_executor
+):
+    """Test that failures raise by default and are skipped on request."""
+    broken = tmp_path / "broken.py"
+    broken.write_text("def broken(:\n")
+    paths = module_files + [broken]
+
+    with pytest.raises(ProcessingError):
+        ModuleAnalyzer().analyze_files(paths, max_workers=2)
+
+    results = ModuleAnalyzer().analyze_files(paths, max_workers=2, skip_errors=True)
+    assert list(results) == module_files
+
+def test_disk_cache_reuses_results(tmp_path: Path, module_files: List[Path]):
+    """Test that a fresh analyzer loads persisted results without parsing."""
+    cache_dir = tmp_path / "cache"
+    path = module_files[0]
+    expected = ModuleAnalyzer(cache_dir=cache_dir).analyze_file(path)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    analyzer = ModuleAnalyzer(cache_dir=cache_dir)
+    analyzer._read_file = None  # Any parse attempt would fail
+    cached = analyzer.analyze_file(path)
+
+    assert cached.exports == expected.exports
+    assert set(cached.classes) == set(expected.classes)
+
+@pytest.mark.parametrize("source, bump_mtime", [
+    ("class Other:\n    pass\n", False),       # size changes
+    ("class Ot:\n    pass\n", True),            # same size, newer mtime
+])
+def test_disk_cache_invalidated_by_file_changes(
+    tmp_path: Path,
+    source: str,
+    bump_mtime: bool
+):
+    """Test that changing a file's size or mtime selects a fresh entry."""
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "module.py"
+    path.write_text("class Ab:\n    pass\n")
+    stat = path.stat()
+    assert "Ab" in ModuleAnalyzer(cache_dir=cache_dir).analyze_file(path).exports
+
+    path.write_text(source)
+    mtime_ns = stat.st_mtime_ns + (1_000_000_000 if bump_mtime else 0)
+    os.utime(path, ns=(stat.st_atime_ns, mtime_ns))
+
+    info = ModuleAnalyzer(cache_dir=cache_dir).analyze_file(path)
+    assert "Ab" not in info.exports
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+@pytest.mark.parametrize("payload", [b"not a pickle", pickle.dumps({"exports": []})])
+def test_disk_cache_ignores_corrupt_entries(
+    tmp_path: Path,
+    module_files: List[Path],
+    payload: bytes
+):
+    """Test that unreadable or foreign entries are re-analyzed and replaced."""
+    cache_dir = tmp_path / "cache"
+    path = module_files[0]
+    ModuleAnalyzer(cache_dir=cache_dir).analyze_file(path)
+    (entry,) = cache_dir.glob("*.pkl")
+    entry.write_bytes(payload)
+
+    info = ModuleAnalyzer(cache_dir=cache_dir).analyze_file(path)
+
+    assert "Widget0" in info.exports
+    with open(entry, 'rb') as f:
+        assert pickle.load(f).exports == info.exports
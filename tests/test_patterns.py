@@ -0,0 +1,79 @@
+"""Test suite for glob pattern matching.
+
+This module pins the path glob semantics of PatternMatcher: wildcards stay
+within one path segment, literals are matched exactly, and patterns match
+whole segments at any directory level.
+
+Path: tests/test_patterns.py
+"""
+
+import pytest
+
+from pyweaver.utils.patterns import PatternMatcher
+
+@pytest.fixture
+def matcher() -> PatternMatcher:
+    """Create a pattern matcher without a root directory."""
+    return PatternMatcher()
+
+@pytest.mark.parametrize("path, pattern, expected", [
+    # Suffix globs match whole names only
+    ("src/module.py", "*.py", True),
+    ("src/module.pyc", "*.py", False),
+    # Leading dots are literal, not wildcards
+    ("repo/.git/HEAD", ".git", True),
+    ("src/digit", ".git", False),
+    # Names match whole path segments at any level
+    ("docs/index.md", "docs", True),
+    ("project/docs/index.md", "docs", True),
+    ("mydocs/index.md", "docs", False),
+    ("docs_old/index.md", "docs", False),
+    # Negated character classes
+    ("pkg/module.py", "[!_]*.py", True),
+    ("pkg/_private.py", "[!_]*.py", False),
+    # A leading '^' in a class is literal, as in fnmatch
+    ("pkg/^module.py", "[^_]*.py", True),
+    ("pkg/_private.py", "[^_]*.py", True),
+    ("pkg/module.py", "[^_]*.py", False),
+    # A leading ']' is a class member, negated or not
+    ("pkg/]a.py", "[]a]a.py", True),
+    ("pkg/ba.py", "[!]a]a.py", True),
+    ("pkg/]a.py", "[!]a]a.py", False),
+    # '**/' matches zero or more directories
+    ("module.py", "**/*.py", True),
+    ("a/b/c/module.py", "**/*.py", True),
+    ("a/b/c/module.pyc", "**/*.py", False),
+    # Single-character and star wildcards never cross '/'
+    ("a/b.py", "a?b.py", False),
+    ("ab.py", "a?.py", True),
+    ("src/a/b.py", "src/*.py", False),
+    ("src/b.py", "src/*.py", True),
+    # Regex metacharacters in globs are literal
+    ("build+1/out", "build+1", True),
+    ("buildd1/out", "build+1", False),
+])
+def test_path_pattern_semantics(
+    matcher: PatternMatcher,
+    path: str,
+    pattern: str,
+    expected: bool
+):
+    """Test matches_path_pattern against pinned glob semantics."""
+    assert matcher.matches_path_pattern(path, pattern) is expected
+
+@pytest.mark.parametrize("path, expected", [
+    ("src/module.py", True),
+    ("src/module.pyc", False),
+    ("repo/.git/config", True),
+    ("src/digit", False),
+])
+def test_compiled_patterns_agree(path: str, expected: bool):
+    """Test that the combined regex agrees with per-pattern matching."""
+    patterns = ["*.py", ".git"]
+    regex = PatternMatcher.compile_path_patterns(patterns)
+
+    assert bool(regex.search(path)) is expected
+    assert any(
+        PatternMatcher().matches_path_pattern(path, pattern)
+        for pattern in patterns
+    ) is expected
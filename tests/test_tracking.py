@@ -0,0 +1,82 @@
+"""Test suite for file tracking.
+
+This module tests the batch status updates of FileTracker and their effect
+on the status counts and the error index.
+
+Path: tests/test_tracking.py
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from pyweaver.common.errors import ProcessingError
+from pyweaver.common.tracking import FileTracker, TrackerStats, TrackerType
+
+@pytest.fixture
+def paths() -> List[Path]:
+    """Create paths for five tracked items."""
+    return [Path(f"pkg/module_{index}.py") for index in range(5)]
+
+@pytest.fixture
+def tracker(paths: List[Path]) -> FileTracker:
+    """Create a tracker with all items pending and the last one in error."""
+    tracker = FileTracker(TrackerType.BOTH, max_attempts=1)
+    for path in paths:
+        tracker.add_pending(path)
+    tracker.mark_error(paths[-1], ValueError("bad module"))
+    return tracker
+
+def test_mark_processed_many(tracker: FileTracker, paths: List[Path]):
+    """Test that only tracked pending items are marked and counted."""
+    marked = tracker.mark_processed_many(
+        path for path in [paths[0], paths[1], Path("pkg/missing.py"), paths[4]]
+    )
+
+    assert marked == 2
+    assert tracker.get_stats() == TrackerStats(
+        pending=2, processing=0, processed=2, ignored=0, errors=1, total=5
+    )
+    assert [path for path, _ in tracker.get_errors()] == [paths[4]]
+
+    # Already processed items are skipped rather than raising
+    assert tracker.mark_processed_many([paths[0], str(paths[2])]) == 1
+    assert tracker.get_stats().processed == 3
+
+def test_mark_ignored_many(tracker: FileTracker, paths: List[Path]):
+    """Test that ignoring items updates counts and clears the error index."""
+    marked = tracker.mark_ignored_many([paths[0], paths[4], Path("pkg/missing.py")])
+
+    assert marked == 2
+    assert tracker.has_pending()
+    assert tracker.get_stats() == TrackerStats(
+        pending=3, processing=0, processed=0, ignored=2, errors=0, total=5
+    )
+    assert tracker.get_errors() == []
+
+def test_batch_marks_match_single_marks(paths: List[Path]):
+    """Test that batch updates leave the same state as per-item updates."""
+    single = FileTracker(TrackerType.BOTH)
+    batch = FileTracker(TrackerType.BOTH)
+    for path in paths:
+        single.add_pending(path)
+        batch.add_pending(path)
+
+    for path in paths[:3]:
+        single.mark_processed(path)
+    for path in paths[3:]:
+        single.mark_ignored(path)
+    batch.mark_processed_many(paths[:3])
+    batch.mark_ignored_many(paths[3:])
+
+    assert batch.get_stats() == single.get_stats()
+    assert not batch.has_pending()
+
+def test_mark_processed_error_names_status(tracker: FileTracker, paths: List[Path]):
+    """Test that an invalid transition reports the status by name."""
+    tracker.mark_processed(paths[0])
+
+    with pytest.raises(ProcessingError) as excinfo:
+        tracker.mark_processed(paths[0])
+    assert "from state: PROCESSED" in str(excinfo.value.original_error)